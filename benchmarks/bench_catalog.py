@@ -0,0 +1,113 @@
+"""
+Compares import time and RSS growth of the old `MANIM_LIBRARY_API` string literal
+against the lazily loaded, pickled `api_catalog`.
+
+Usage:
+    python benchmarks/bench_catalog.py [--runs N]
+
+Every measurement runs in a fresh interpreter. The literal is measured both
+cold (compiled from source, as on the first import) and warm (from its .pyc).
+
+Loading the catalog is slower and larger than importing the warm literal: it
+unpickles thousands of objects and imports the catalog module's own
+dependencies. The difference is reported as a regression at the end.
+"""
+
+from argparse import ArgumentParser
+from os.path import abspath, dirname, join
+from statistics import median
+from subprocess import run
+from tempfile import TemporaryDirectory
+
+from typing import Dict, List, Tuple
+
+import json
+import sys
+
+SRC_DIR: str = join(dirname(dirname(abspath(__file__))), "src")
+
+# Prints the time taken by `code` and the resident set growth it caused, in KiB.
+MEASURE: str = """
+import json, os, resource, sys, time
+def rss_kib():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+sys.path.insert(0, {path!r})
+{prelude}
+before = rss_kib()
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "rss_kib": rss_kib() - before}}))
+"""
+
+LITERAL_CODE: str = "from literal_api import MANIM_LIBRARY_API"
+CATALOG_IMPORT_CODE: str = "import mAInim.api_catalog"
+CATALOG_LOAD_CODE: str = (
+    "from mAInim.api_catalog import get_catalog\n"
+    "get_catalog().find_method('Circle', 'set_color')"
+)
+
+
+# Stdlib modules the catalog imports, preloaded to separate their cost from the catalog's own.
+STDLIB_PRELUDE: str = "import dataclasses, hashlib, pickle, typing"
+
+
+def measure(
+    path: str, code: str, flags: Tuple[str, ...] = (), prelude: str = ""
+) -> Dict[str, float]:
+    script: str = MEASURE.format(path=path, code=code, prelude=prelude)
+    output: str = run(
+        [sys.executable, *flags, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def report(name: str, samples: List[Dict[str, float]]) -> Tuple[float, float]:
+    seconds: float = median(sample["seconds"] for sample in samples)
+    rss: float = median(sample["rss_kib"] for sample in samples)
+    print(f"{name:>24}: {seconds * 1000:8.2f} ms, RSS +{rss:,.0f} KiB")
+    return seconds, rss
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(join(SRC_DIR, "mAInim", "manim_api.txt")) as f:
+        reference: str = f.read()
+
+    with TemporaryDirectory() as temporary_dir:
+        with open(join(temporary_dir, "literal_api.py"), "w") as f:
+            f.write(f'MANIM_LIBRARY_API: str = """\n{reference}"""\n')
+
+        report(
+            "literal (cold, no .pyc)",
+            [measure(temporary_dir, LITERAL_CODE, ("-B",)) for _ in range(args.runs)],
+        )
+        measure(temporary_dir, LITERAL_CODE)  # Writes the .pyc.
+        literal: Tuple[float, float] = report(
+            "literal (warm .pyc)", [measure(temporary_dir, LITERAL_CODE) for _ in range(args.runs)]
+        )
+
+    measure(SRC_DIR, CATALOG_LOAD_CODE)  # Compiles and caches the catalog pickle.
+    report("catalog import only", [measure(SRC_DIR, CATALOG_IMPORT_CODE) for _ in range(args.runs)])
+    catalog: Tuple[float, float] = report(
+        "catalog import + load", [measure(SRC_DIR, CATALOG_LOAD_CODE) for _ in range(args.runs)]
+    )
+    report(
+        "catalog, stdlib preloaded",
+        [measure(SRC_DIR, CATALOG_LOAD_CODE, prelude=STDLIB_PRELUDE) for _ in range(args.runs)],
+    )
+    print(
+        f"Regression of the catalog over the warm literal: "
+        f"+{(catalog[0] - literal[0]) * 1000:.2f} ms, RSS +{catalog[1] - literal[1]:,.0f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measures what importing the package costs and checks that no heavy dependency is
+loaded as a side effect.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N]
+
+Every measurement runs `python -X importtime` in a fresh interpreter and reports the
+median cumulative import time. Exits with a non-zero status when a module is over its
+budget or pulls in one of `HEAVY_MODULES`.
+"""
+
+from argparse import ArgumentParser
+from os import environ
+from os.path import abspath, dirname, join
+from statistics import median
+from subprocess import run
+
+from typing import Dict, List, Tuple
+
+import sys
+
+SRC_DIR: str = join(dirname(dirname(abspath(__file__))), "src")
+
+# Cumulative import time budgets, in milliseconds. `mAInim.mvp` needs asyncio.
+BUDGETS_MS: Dict[str, float] = {
+    "mAInim": 20.0,
+    "mAInim.mvp": 150.0,
+}
+
+HEAVY_MODULES: Tuple[str, ...] = ("httpx", "libcst", "lmstudio", "manim", "sqlite3")
+
+
+def import_times(module: str) -> Dict[str, float]:
+    """
+    Returns the cumulative import time in milliseconds of every module loaded by `import module`.
+    """
+    output: str = run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**environ, "PYTHONPATH": SRC_DIR},
+    ).stderr
+
+    times: Dict[str, float] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="Heaviest imports to list.")
+    args = parser.parse_args()
+
+    # Modules the interpreter loads at startup (site, .pth hooks) are not ours to budget.
+    startup: Dict[str, float] = import_times("sys")
+
+    failed: bool = False
+    for module, budget in BUDGETS_MS.items():
+        runs: List[Dict[str, float]] = [import_times(module) for _ in range(args.runs)]
+        total: float = median(times[module] for times in runs)
+        print(f"{module:>12}: {total:7.2f} ms (budget {budget:.0f} ms)")
+
+        # Top-level modules only; their cumulative time already includes their children.
+        heaviest: List[Tuple[str, float]] = sorted(
+            (
+                (name, time)
+                for name, time in runs[-1].items()
+                if "." not in name and name != module and name not in startup
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        for name, time in heaviest[: args.top]:
+            print(f"{'':>14}{name}: {time:.2f} ms")
+
+        loaded: List[str] = [
+            name for name in HEAVY_MODULES if any(n.split(".")[0] == name for n in runs[-1])
+        ]
+        if loaded:
+            print(f"{'':>14}imports heavy module(s): {', '.join(loaded)}")
+        failed |= total > budget or bool(loaded)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
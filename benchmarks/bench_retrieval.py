@@ -0,0 +1,104 @@
+"""
+Compares prompt size and latency when sending the full Manim API reference
+versus only the sections picked by `api_retrieval`.
+
+Usage:
+    python benchmarks/bench_retrieval.py [--send] [--url URL] [--top-k K] [--token-budget N]
+
+Without `--send` only the prompt construction time is measured; with it, every
+prompt is POSTed to the backend and the end-to-end latency is reported as well.
+"""
+
+from argparse import ArgumentParser
+from os.path import abspath, dirname, join
+from statistics import median
+from time import perf_counter
+
+from typing import Callable, Dict, List
+
+import asyncio
+import sys
+
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), "src"))
+
+from mAInim.api_catalog import get_catalog  # noqa: E402
+from mAInim.api_retrieval import build_index, select_api_sections  # noqa: E402
+from mAInim.prompts import build_prompt  # noqa: E402
+
+GEMINI_URL: str = "https://gemini-wrapper-nine.vercel.app/gemini"
+
+PROMPTS: List[str] = [
+    "Create a cool animation.",
+    "Draw a circle that transforms into a square.",
+    "Plot the graph of sin(x) on a set of axes and trace a dot along it.",
+    "Write the quadratic formula with MathTex and highlight the discriminant.",
+    "Show a 3D surface of z = x^2 - y^2 rotating slowly.",
+    "Animate a number line with a moving arrow and a changing decimal number.",
+    "Create a bar chart of the first five prime numbers.",
+    "Show the Pythagorean theorem with squares on each side of a right triangle.",
+    "Fade in a table of values and then indicate the largest entry.",
+    "Morph the text 'Hello' into 'World' and spin it around.",
+]
+
+
+async def send(url: str, prompts: List[str]) -> List[float]:
+    from httpx import AsyncClient
+
+    latencies: List[float] = []
+    async with AsyncClient(timeout=300) as client:
+        for prompt in prompts:
+            start: float = perf_counter()
+            response = await client.post(url, json={"prompt": prompt})
+            response.raise_for_status()
+            latencies.append(perf_counter() - start)
+    return latencies
+
+
+def run(name: str, make_reference: Callable[[str], str], args) -> Dict[str, float]:
+    prompts: List[str] = []
+    build_times: List[float] = []
+    for user_prompt in PROMPTS:
+        start: float = perf_counter()
+        prompts.append(build_prompt(user_prompt, make_reference(user_prompt)))
+        build_times.append(perf_counter() - start)
+
+    sizes: List[int] = [len(prompt.encode()) for prompt in prompts]
+    result: Dict[str, float] = {
+        "median_bytes": median(sizes),
+        "median_est_tokens": median(sizes) / 4,
+        "median_build_ms": median(build_times) * 1000,
+    }
+    if args.send:
+        result["median_latency_s"] = median(asyncio.run(send(args.url, prompts)))
+
+    print(f"{name:>10}: " + ", ".join(f"{key}={value:,.1f}" for key, value in result.items()))
+    return result
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--send", action="store_true", help="POST every prompt to the backend")
+    parser.add_argument("--url", default=GEMINI_URL)
+    parser.add_argument("--top-k", type=int, default=12)
+    parser.add_argument("--token-budget", type=int, default=8000)
+    args = parser.parse_args()
+
+    api_text: str = get_catalog().text
+
+    start: float = perf_counter()
+    build_index(api_text)
+    print(f"Index build: {(perf_counter() - start) * 1000:.1f} ms")
+
+    full = run("full dump", lambda _: api_text, args)
+    retrieved = run(
+        "retrieval",
+        lambda prompt: select_api_sections(
+            prompt, api_text, top_k=args.top_k, token_budget=args.token_budget
+        ),
+        args,
+    )
+    print(f"Prompt size reduction: {full['median_bytes'] / retrieved['median_bytes']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
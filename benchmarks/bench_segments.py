@@ -0,0 +1,132 @@
+"""
+Measures the wall-clock time of rendering one long scene split into a growing number
+of segments, rendered in parallel and joined with ffmpeg (see `mAInim.segments`).
+
+Usage:
+    python benchmarks/bench_segments.py [--animations N] [--segments 1 2 4 8 16]
+                                        [--concurrency N] [--render-pool]
+
+Needs manim and ffmpeg. Every run renders into a fresh directory, so nothing is
+served from the render cache. The joined video's duration is checked against the
+unsegmented render with ffprobe, where available.
+"""
+
+from argparse import ArgumentParser
+from asyncio import run as run_async
+from contextlib import redirect_stdout
+from io import StringIO
+from os import cpu_count
+from shutil import which
+from subprocess import run
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from typing import Dict, List, Tuple
+
+import sys
+
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), "src"))
+
+from mAInim import mvp  # noqa: E402
+
+# One step of the scene; repeated to reach the requested number of animations.
+STEP: str = """\
+        square_{i} = Square(side_length={r}).set_fill(BLUE, opacity=0.5).shift(LEFT * {x})
+        self.play(Create(square_{i}))
+        self.play(square_{i}.animate.rotate(PI / 3).shift(RIGHT * 2), run_time=1.5)
+        self.play(Transform(square_{i}, Circle(radius={r} / 2).shift(UP)))
+        self.wait(0.5)
+        self.play(FadeOut(square_{i}))
+"""
+
+
+def make_scene(animations: int) -> str:
+    steps: List[str] = [
+        STEP.format(i=i, r=1 + i % 3, x=i % 4) for i in range(max(1, animations // 5))
+    ]
+    return (
+        "from manim import *\n\n\n"
+        "class LongScene(Scene):\n"
+        "    def construct(self):\n"
+        "        title = Text('Segments').to_edge(UP)\n"
+        "        self.add(title)\n" + "".join(steps)
+    )
+
+
+def duration(video_path: str) -> float | None:
+    ffprobe: str | None = which("ffprobe")
+    if ffprobe is None:
+        return None
+    output: str = run(
+        [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", video_path],
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output) if output.strip() else None
+
+
+async def render_all(
+    code: str, segment_counts: List[int], render_pool: bool
+) -> Dict[int, Tuple[float, str | None, float | None]]:
+    """
+    Renders the code once per segment count, in one event loop so the render pool
+    (if used) stays warm; returns the seconds, video and video duration of each.
+    """
+    results: Dict[int, Tuple[float, str | None, float | None]] = {}
+    for segments in segment_counts:
+        with TemporaryDirectory() as path:
+            start: float = perf_counter()
+            with redirect_stdout(StringIO()):
+                video_path: str | None = await mvp.run_manim_code(
+                    code,
+                    path,
+                    use_render_pool=render_pool,
+                    headless=True,
+                    validate=False,
+                    segments=segments,
+                )
+            seconds: float = perf_counter() - start
+            length: float | None = duration(video_path) if video_path is not None else None
+            results[segments] = (seconds, video_path, length)
+    return results
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--animations", type=int, default=80)
+    parser.add_argument("--segments", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--concurrency", type=int, default=cpu_count() or 1)
+    parser.add_argument("--render-pool", action="store_true", help="Render on the worker pool.")
+    args = parser.parse_args()
+
+    missing: List[str] = [tool for tool in ("manim", "ffmpeg") if which(tool) is None]
+    if missing:
+        print(f"Skipping: {', '.join(missing)} not found.")
+        return
+
+    # Segments are CPU-bound processes; let as many run as there are cores.
+    mvp.SCENE_CONCURRENCY = args.concurrency
+    results: Dict[int, Tuple[float, str | None, float | None]] = run_async(
+        render_all(make_scene(args.animations), args.segments, args.render_pool)
+    )
+
+    baseline: float = results[args.segments[0]][0]
+    for segments, (seconds, video_path, length) in results.items():
+        if video_path is None:
+            print(f"{segments:>3} segment(s): render failed")
+            sys.exit(1)
+        print(
+            f"{segments:>3} segment(s): {seconds:7.2f} s, {baseline / seconds:5.2f}x"
+            + (f", video {length:.2f} s" if length is not None else "")
+        )
+
+    lengths: List[float] = [length for _, _, length in results.values() if length is not None]
+    if lengths and max(lengths) - min(lengths) > 0.1:
+        print(f"Joined videos differ in length: {lengths}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
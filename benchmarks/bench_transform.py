@@ -0,0 +1,144 @@
+"""
+Measures the time and memory taken by `add_interactivity` on large generated scenes,
+against the previous transformer that re-generated the module source to search it and
+re-parsed the injected statements on every call.
+
+Usage:
+    python benchmarks/bench_transform.py [--lines 1000 5000 10000] [--runs N]
+
+Parsing is not measured: both transformers receive the same parsed module, as they do
+when the code was parsed while streaming. Memory is the tracemalloc peak. The time
+spent in each transform pass is listed below every size.
+"""
+
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from io import StringIO
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from typing import Callable, List, Tuple
+
+import sys
+import tracemalloc
+
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), "src"))
+
+import libcst as cst  # noqa: E402
+import libcst.matchers as m  # noqa: E402
+
+from mAInim.cst_parser import add_interactivity  # noqa: E402
+from mAInim.transform_pipeline import TransformPipeline  # noqa: E402
+
+# One animation step of a generated scene; repeated to reach the requested size.
+STEP: str = """\
+        circle_{i} = Circle(radius={r}).set_color(BLUE)
+        square_{i} = Square(side_length={r}).next_to(circle_{i}, RIGHT)
+        self.play(Create(circle_{i}), run_time=1)
+        self.play(Transform(circle_{i}, square_{i}), run_time=0.5)
+        self.play(FadeOut(circle_{i}, square_{i}))
+"""
+
+
+def make_scene(lines: int) -> str:
+    steps: List[str] = [STEP.format(i=i, r=1 + i % 3) for i in range(max(1, lines // 5))]
+    return (
+        "from manim import *\n\n\n"
+        "class GeneratedScene(ThreeDScene):\n"
+        "    def construct(self):\n"
+        "        surface = OpenGLSurface(lambda u, v: (u, v, u * v))\n"
+        + "".join(steps)
+    )
+
+
+class LegacyTransformer(cst.CSTTransformer):
+    """
+    The transformer as it was before facts were collected during the walk.
+    """
+
+    def leave_Module(self, _: cst.Module, updated_node: cst.Module) -> cst.Module:
+        if "OpenGLSurface" not in updated_node.code:
+            return updated_node
+        import_statement = cst.parse_statement(
+            "from manim.mobject.opengl.opengl_three_dimensions import OpenGLSurface"
+        )
+        return updated_node.with_changes(body=[import_statement, *list(updated_node.body)])
+
+    def leave_FunctionDef(
+        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
+    ) -> cst.FunctionDef:
+        if original_node.name.value != "construct":
+            return updated_node
+        interactive_code = cst.parse_statement("self.interactive_embed()")
+        return updated_node.with_changes(
+            body=cst.IndentedBlock(body=[*updated_node.body.body, interactive_code])
+        )
+
+    def leave_Arg(self, original_node: cst.Arg, updated_node: cst.Arg):
+        if m.matches(
+            original_node,
+            m.Arg(value=m.OneOf(m.Integer(), m.Float()), keyword=m.Name(value="run_time")),
+        ):
+            return cst.RemoveFromParent()
+        return updated_node
+
+
+def legacy_add_interactivity(module: cst.Module, path: str) -> cst.Module:
+    updated: cst.Module = module.visit(LegacyTransformer())
+    with open(join(path, "generated_code.py"), "w") as f:
+        f.write(updated.code)
+    # The old render path read `module.code` again for the render cache key and the worker job.
+    updated.code
+    updated.code
+    return updated
+
+
+def measure(transform: Callable[[], object], runs: int) -> Tuple[float, float]:
+    """
+    Returns the median seconds and the median tracemalloc peak in MiB of `transform`.
+    """
+    seconds: List[float] = []
+    peaks: List[float] = []
+    with redirect_stdout(StringIO()):  # Silences the progress messages of `add_interactivity`.
+        for _ in range(runs):
+            start: float = perf_counter()
+            transform()
+            seconds.append(perf_counter() - start)
+
+            tracemalloc.start()
+            transform()
+            peaks.append(tracemalloc.get_traced_memory()[1] / 2**20)
+            tracemalloc.stop()
+    return median(seconds), median(peaks)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as path:
+        for lines in args.lines:
+            module: cst.Module = cst.parse_module(make_scene(lines))
+            legacy: Tuple[float, float] = measure(
+                lambda: legacy_add_interactivity(module, path), args.runs
+            )
+            current: Tuple[float, float] = measure(
+                lambda: add_interactivity(module, path), args.runs
+            )
+            print(
+                f"{lines:>6} lines: legacy {legacy[0] * 1000:8.1f} ms {legacy[1]:6.1f} MiB | "
+                f"current {current[0] * 1000:8.1f} ms {current[1]:6.1f} MiB | "
+                f"{legacy[0] / current[0]:.2f}x faster"
+            )
+            pipeline: TransformPipeline = TransformPipeline()
+            pipeline.run(module)
+            print(f"{'':>14}{pipeline.report()}")
+
+
+if __name__ == "__main__":
+    main()
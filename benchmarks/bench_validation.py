@@ -0,0 +1,285 @@
+"""
+Measures the static pre-render validation on a corpus of generated scenes and
+counts the renders it prevents.
+
+Usage:
+    python benchmarks/bench_validation.py [--runs N] [--verbose]
+
+The corpus mixes valid scenes with the failure modes seen in generated code:
+misspelled and hallucinated classes, methods and keyword arguments, missing
+scenes and code that does not compile. Every rejected scene is a
+render that would otherwise have started manim only to crash.
+"""
+
+from argparse import ArgumentParser
+from os.path import abspath, dirname, join
+from shutil import which
+from statistics import median
+from subprocess import run
+from time import perf_counter
+
+from typing import Dict, List, Tuple
+
+import sys
+
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), "src"))
+
+from mAInim.api_catalog import get_catalog  # noqa: E402
+from mAInim.validation import ValidationResult, validate_code  # noqa: E402
+
+# Name -> (code, expected outcome: "valid", "fixed" or "rejected").
+CORPUS: Dict[str, Tuple[str, str]] = {
+    "circle_to_square": (
+        """from manim import *
+
+class CircleToSquare(Scene):
+    def construct(self):
+        circle = Circle(radius=1.5)
+        circle.set_fill(BLUE, opacity=0.5)
+        square = Square(side_length=3)
+        self.play(Create(circle))
+        self.play(Transform(circle, square))
+        self.play(FadeOut(circle))
+        self.wait(1)
+""",
+        "valid",
+    ),
+    "sine_graph": (
+        """from manim import *
+import numpy as np
+
+class SineGraph(Scene):
+    def construct(self):
+        axes = Axes(x_range=[-PI, PI, 1], y_range=[-1.5, 1.5, 0.5])
+        graph = axes.plot(lambda x: np.sin(x), color=YELLOW)
+        dot = Dot(axes.i2gp(-PI, graph))
+        self.play(Create(axes), Create(graph))
+        self.play(MoveAlongPath(dot, graph), run_time=3)
+        self.wait()
+""",
+        "valid",
+    ),
+    "value_tracker": (
+        """from manim import *
+
+class Counter(Scene):
+    def construct(self):
+        tracker = ValueTracker(0)
+        number = always_redraw(lambda: DecimalNumber(tracker.get_value()).to_edge(UP))
+        line = NumberLine(x_range=[0, 10, 1])
+        arrow = always_redraw(lambda: Arrow(UP, DOWN).next_to(line.n2p(tracker.get_value()), UP))
+        self.add(line, number, arrow)
+        self.play(tracker.animate.set_value(10), run_time=4)
+""",
+        "valid",
+    ),
+    "helpers_and_subclass": (
+        """from manim import *
+
+def labelled(mobject, text):
+    return VGroup(mobject, Text(text).next_to(mobject, DOWN))
+
+class BaseScene(Scene):
+    def title(self, text):
+        self.play(Write(Text(text).to_edge(UP)))
+
+class Pythagoras(BaseScene):
+    def construct(self):
+        self.title("a^2 + b^2 = c^2")
+        triangle = Polygon(ORIGIN, RIGHT * 3, UP * 4)
+        self.play(Create(labelled(triangle, "right triangle")))
+        self.play(Indicate(triangle))
+""",
+        "valid",
+    ),
+    "helix_3d": (
+        """from manim import *
+import numpy as np
+
+class Helix(ThreeDScene):
+    def construct(self):
+        self.set_camera_orientation(phi=75 * DEGREES, theta=30 * DEGREES)
+        axes = ThreeDAxes()
+        helix = ParametricFunction(lambda t: axes.c2p(np.cos(t), np.sin(t), t / 4), t_range=[0, 4 * PI])
+        self.play(Create(axes), Create(helix))
+        self.begin_ambient_camera_rotation(rate=0.2)
+        self.wait(3)
+""",
+        "valid",
+    ),
+    "misspelled_classes": (
+        """from manim import *
+
+class Typos(Scene):
+    def construct(self):
+        circle = Cirlce(radius=1)
+        self.play(Creat(circle))
+        self.play(FadeOut(circle))
+""",
+        "fixed",
+    ),
+    "wrong_keyword": (
+        """from manim import *
+
+class Colors(Scene):
+    def construct(self):
+        square = Square()
+        square.set_color(RED, opacity=0.5)
+        self.play(DrawBorderThenFill(square))
+""",
+        "fixed",
+    ),
+    "hallucinated_animation": (
+        """from manim import *
+
+class Morph(Scene):
+    def construct(self):
+        text = Text("Hello")
+        self.play(Write(text))
+        self.play(MorphText(text, Text("World")))
+""",
+        "rejected",
+    ),
+    "hallucinated_mobject": (
+        """from manim import *
+
+class Chart(Scene):
+    def construct(self):
+        chart = PieChart(values=[1, 2, 3])
+        self.play(Create(chart))
+""",
+        "rejected",
+    ),
+    "hallucinated_method": (
+        """from manim import *
+
+class Glow(Scene):
+    def construct(self):
+        star = Star()
+        star.add_glow(intensity=2)
+        self.play(SpinInFromNothing(star))
+""",
+        "rejected",
+    ),
+    "hallucinated_scene_method": (
+        """from manim import *
+
+class Zoom(Scene):
+    def construct(self):
+        dot = Dot()
+        self.add(dot)
+        self.zoom_camera_to(dot, factor=2)
+""",
+        "rejected",
+    ),
+    "no_scene": (
+        """from manim import *
+
+class Drawing(VGroup):
+    def construct(self):
+        self.add(Circle())
+""",
+        "rejected",
+    ),
+    "no_construct": (
+        """from manim import *
+
+class Empty(Scene):
+    def setup(self):
+        self.add(Circle())
+""",
+        "rejected",
+    ),
+    "two_scenes": (
+        """from manim import *
+
+class First(Scene):
+    def construct(self):
+        self.play(Create(Circle()))
+
+class Second(Scene):
+    def construct(self):
+        self.play(Create(Square()))
+""",
+        "valid",
+    ),
+    "does_not_compile": (
+        """from manim import *
+
+class Broken(Scene):
+    def construct(self):
+        self.play(Create(Circle())
+        self.wait()
+""",
+        "rejected",
+    ),
+    "return_outside_function": (
+        """from manim import *
+
+return Circle()
+""",
+        "rejected",
+    ),
+}
+
+
+def outcome(result: ValidationResult) -> str:
+    if not result.ok:
+        return "rejected"
+    return "fixed" if result.fixed else "valid"
+
+
+def manim_startup_seconds() -> float | None:
+    """
+    Returns how long the manim CLI takes to start, or None when it is not installed.
+    """
+    manim_path: str | None = which("manim")
+    if manim_path is None:
+        return None
+    start: float = perf_counter()
+    run([manim_path, "--version"], capture_output=True)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--verbose", action="store_true", help="List every issue found.")
+    args = parser.parse_args()
+
+    start: float = perf_counter()
+    get_catalog()
+    print(f"Catalog load: {(perf_counter() - start) * 1000:.1f} ms")
+
+    seconds: List[float] = []
+    counts: Dict[str, int] = {"valid": 0, "fixed": 0, "rejected": 0}
+    mismatches: List[str] = []
+    for name, (code, expected) in CORPUS.items():
+        results: List[ValidationResult] = [validate_code(code) for _ in range(args.runs)]
+        seconds.append(median(result.seconds for result in results))
+        got: str = outcome(results[-1])
+        counts[got] += 1
+        if got != expected:
+            mismatches.append(f"{name} (expected {expected}, got {got})")
+        print(f"{name:>26}: {got:<8} {seconds[-1] * 1000:6.2f} ms")
+        if args.verbose:
+            for issue in results[-1].issues:
+                print(f"{'':>28}{issue}")
+
+    print(
+        f"\n{len(CORPUS)} scenes: {counts['valid']} valid, {counts['fixed']} fixed, "
+        f"{counts['rejected']} rejected (renders prevented)"
+    )
+    print(f"Validation time: median {median(seconds) * 1000:.2f} ms, max {max(seconds) * 1000:.2f} ms")
+
+    startup: float | None = manim_startup_seconds()
+    if startup is not None:
+        print(f"manim CLI start-up alone: {startup * 1000:.0f} ms per prevented render")
+
+    if mismatches:
+        print(f"Unexpected outcomes: {', '.join(mismatches)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,37 @@
-from . import mvp
-from . import cst_parser
\ No newline at end of file
+"""
+Merging Manim & AI.
+
+Importing the package has no side effects and loads none of its heavy
+dependencies; submodules and the main entry points are imported on first use.
+"""
+
+from importlib import import_module
+
+from typing import Any
+
+# Public names re-exported from `mvp`, resolved lazily.
+_MVP_EXPORTS: frozenset = frozenset(
+    {
+        "generate_code",
+        "generate_video",
+        "generate_videos",
+        "render_tiers",
+        "request_code",
+        "run_manim_code",
+        "GeneratedCode",
+        "VideoResult",
+    }
+)
+
+__all__ = sorted(_MVP_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MVP_EXPORTS:
+        return getattr(import_module(".mvp", __name__), name)
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
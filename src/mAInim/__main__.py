@@ -0,0 +1,25 @@
+"""
+Generates and renders a video from the command line:
+
+    python -m mAInim [--tiered] [prompt]
+
+With `--tiered`, a still and a preview are rendered before the final video (see `tiers`).
+"""
+
+import asyncio
+import sys
+
+from typing import List
+
+from .mvp import generate_video
+
+
+def main() -> None:
+    args: List[str] = sys.argv[1:]
+    tiered: bool = "--tiered" in args
+    prompt: str = " ".join(arg for arg in args if arg != "--tiered") or "Create a cool animation."
+    asyncio.run(generate_video(prompt, max_retries=5, tiered=tiered))
+
+
+if __name__ == "__main__":
+    main()
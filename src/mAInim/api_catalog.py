@@ -0,0 +1,301 @@
+"""
+A structured, queryable catalog of the Manim API (module -> class -> method signatures).
+
+The catalog is compiled from the bundled `manim_api.txt` reference the first time
+it is needed and cached on disk as a pickle keyed by the reference's hash, so
+later processes only pay for unpickling it.
+"""
+
+from dataclasses import dataclass, field
+from functools import cache, cached_property
+from hashlib import sha256
+from os import replace
+from os.path import dirname, exists, join
+from threading import Lock
+
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple
+
+import pickle
+
+from .paths import cache_dir
+
+FILE_SEPARATOR: str = "+" * 50
+BLOCK_SEPARATOR: str = "-" * 50
+FILE_HEADER: str = "Current file: "
+
+API_REFERENCE_PATH: str = join(dirname(__file__), "manim_api.txt")
+API_REFERENCE_MANIM_VERSION: str = "0.19.0"
+
+# Bump whenever the pickled layout of the classes below changes.
+CATALOG_FORMAT: int = 3
+
+# Serializes the first `get_catalog`, which async callers run in worker threads.
+_catalog_lock: Lock = Lock()
+
+
+@dataclass(frozen=True)
+class ApiFunction:
+    name: str
+    signature: str
+    # The decorator making the method a property, e.g. `@property` or `@width.setter`.
+    decorator: str = ""
+
+    @property
+    def is_property(self) -> bool:
+        return bool(self.decorator)
+
+    @property
+    def declaration(self) -> str:
+        return f"{self.decorator}\n{self.signature}" if self.decorator else self.signature
+
+
+@dataclass
+class ApiClass:
+    name: str
+    bases: Tuple[str, ...]
+    methods: List[ApiFunction] = field(default_factory=list)
+
+    @property
+    def header(self) -> str:
+        return f"class {self.name}({', '.join(self.bases)}):" if self.bases else f"class {self.name}:"
+
+    def find_method(self, name: str) -> ApiFunction | None:
+        return next((method for method in self.methods if method.name == name), None)
+
+
+@dataclass
+class ApiModule:
+    path: str
+    functions: List[ApiFunction] = field(default_factory=list)
+    classes: Dict[str, ApiClass] = field(default_factory=dict)
+
+
+@dataclass
+class ApiCatalog:
+    """
+    All modules, classes and functions of the Manim API reference.
+
+    `exports` holds every name `from manim import *` provides, when the catalog was
+    generated from an installed manim (empty for the bundled reference).
+    """
+
+    modules: Dict[str, ApiModule]
+    version: str
+    manim_version: str = API_REFERENCE_MANIM_VERSION
+    exports: FrozenSet[str] = frozenset()
+
+    def __getstate__(self) -> Dict:
+        # Never persist the cached_property values, they are cheap to rebuild.
+        return {
+            "modules": self.modules,
+            "version": self.version,
+            "manim_version": self.manim_version,
+            "exports": self.exports,
+        }
+
+    @cached_property
+    def _classes(self) -> Dict[str, ApiClass]:
+        classes: Dict[str, ApiClass] = {}
+        # `manim.utils` is not star-exported, so its classes lose any name clash.
+        for module in sorted(self.modules.values(), key=lambda module: "/utils/" in module.path):
+            for name, api_class in module.classes.items():
+                classes.setdefault(name, api_class)
+        return classes
+
+    @cached_property
+    def _functions(self) -> Dict[str, ApiFunction]:
+        functions: Dict[str, ApiFunction] = {}
+        for module in self.modules.values():
+            for function in module.functions:
+                functions.setdefault(function.name, function)
+        return functions
+
+    def class_names(self) -> Iterable[str]:
+        return self._classes.keys()
+
+    def function_names(self) -> Iterable[str]:
+        return self._functions.keys()
+
+    def find_class(self, name: str) -> ApiClass | None:
+        return self._classes.get(name)
+
+    def find_function(self, name: str) -> ApiFunction | None:
+        return self._functions.get(name)
+
+    def mro(self, name: str) -> Iterator[ApiClass]:
+        """
+        Yields the class and its known base classes, depth first.
+        """
+        seen: set = set()
+        pending: List[str] = [name]
+        while pending:
+            api_class: ApiClass | None = self._classes.get(pending.pop(0))
+            if api_class is None or api_class.name in seen:
+                continue
+            seen.add(api_class.name)
+            yield api_class
+            pending.extend(base.split("[", 1)[0].split(".")[-1] for base in api_class.bases)
+
+    def find_method(self, class_name: str, method_name: str) -> ApiFunction | None:
+        """
+        Looks a method up on the class or any of its known base classes.
+        """
+        for api_class in self.mro(class_name):
+            method: ApiFunction | None = api_class.find_method(method_name)
+            if method is not None:
+                return method
+        return None
+
+    def lookup(self, name: str) -> ApiModule | ApiClass | ApiFunction | None:
+        """
+        Resolves a module path, class name, function name or `Class.method` name.
+        """
+        if name in self.modules:
+            return self.modules[name]
+        if "." in name:
+            class_name, _, method_name = name.rpartition(".")
+            return self.find_method(class_name, method_name)
+        return self.find_class(name) or self.find_function(name)
+
+    def render(self, modules: Iterable[str] | None = None) -> str:
+        """
+        Renders the catalog (or only the given modules) in the API reference text layout.
+        """
+        chunks: List[str] = []
+        for path in self.modules if modules is None else modules:
+            module: ApiModule = self.modules[path]
+            chunks.append(f"\n{FILE_SEPARATOR}\n\n{FILE_HEADER}{path}\n")
+            if module.functions:
+                chunks.append("\n".join(function.declaration for function in module.functions))
+            for api_class in module.classes.values():
+                methods: str = "\n".join(method.declaration for method in api_class.methods)
+                chunks.append(f"{BLOCK_SEPARATOR}\n\n{api_class.header}\n\n{methods}\n{BLOCK_SEPARATOR}\n")
+        return "\n".join(chunks)
+
+    @cached_property
+    def text(self) -> str:
+        return self.render()
+
+
+def _split_bases(header: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Splits `class Name(Base, Other[T]):` into its name and top-level base expressions.
+    """
+    declaration: str = header[len("class ") :].rstrip().rstrip(":")
+    if "(" not in declaration:
+        return declaration.strip(), ()
+
+    name, _, rest = declaration.partition("(")
+    bases: List[str] = []
+    depth: int = 0
+    current: str = ""
+    for character in rest[: rest.rfind(")")]:
+        if character == "," and depth == 0:
+            bases.append(current.strip())
+            current = ""
+            continue
+        depth += character in "([{"
+        depth -= character in ")]}"
+        current += character
+    if current.strip():
+        bases.append(current.strip())
+    return name.strip(), tuple(bases)
+
+
+def _parse_functions(lines: Iterable[str]) -> List[ApiFunction]:
+    """
+    Groups `def ...` lines and their continuation lines into functions, each with
+    the property decorator line before it, if any.
+    """
+    functions: List[ApiFunction] = []
+    current: List[str] = []
+    decorator: str = ""
+    for line in lines:
+        if line.startswith(("def ", "@")) and current:
+            functions.append(_make_function(current, decorator))
+            current, decorator = [], ""
+        if line.startswith("@"):
+            decorator = line.strip()
+        elif line.startswith("def ") or current:
+            current.append(line)
+    if current:
+        functions.append(_make_function(current, decorator))
+    return functions
+
+
+def _make_function(lines: List[str], decorator: str = "") -> ApiFunction:
+    signature: str = "\n".join(lines).rstrip()
+    return ApiFunction(signature[len("def ") : signature.find("(")].strip(), signature, decorator)
+
+
+def parse_api_reference(text: str, manim_version: str = API_REFERENCE_MANIM_VERSION) -> ApiCatalog:
+    """
+    Parses the text API reference into an `ApiCatalog`.
+    """
+    modules: Dict[str, ApiModule] = {}
+    for file_chunk in text.split(FILE_SEPARATOR):
+        file_chunk = file_chunk.strip()
+        if not file_chunk.startswith(FILE_HEADER):
+            continue
+
+        header, _, rest = file_chunk.partition("\n")
+        module: ApiModule = ApiModule(header[len(FILE_HEADER) :].strip())
+        modules[module.path] = module
+
+        for block in rest.split(BLOCK_SEPARATOR):
+            lines: List[str] = [line for line in block.strip().splitlines() if line.strip()]
+            if not lines:
+                continue
+            if lines[0].startswith("class "):
+                name, bases = _split_bases(lines[0])
+                module.classes[name] = ApiClass(name, bases, _parse_functions(lines[1:]))
+            else:
+                module.functions.extend(_parse_functions(lines))
+
+    version: str = sha256(text.encode()).hexdigest()[:16]
+    return ApiCatalog(modules, version, manim_version)
+
+
+def load_catalog(reference_path: str = API_REFERENCE_PATH) -> ApiCatalog:
+    """
+    Loads the compiled catalog for `reference_path`, compiling and caching it on a miss.
+    """
+    with open(reference_path, "rb") as f:
+        raw: bytes = f.read()
+    digest: str = sha256(raw).hexdigest()[:16]
+    pickle_path: str = join(cache_dir("catalog"), f"api_catalog-v{CATALOG_FORMAT}-{digest}.pickle")
+
+    if exists(pickle_path):
+        try:
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+            pass  # A stale or corrupt cache is simply rebuilt below.
+
+    catalog: ApiCatalog = parse_api_reference(raw.decode())
+    temporary_path: str = f"{pickle_path}.tmp"
+    with open(temporary_path, "wb") as f:
+        pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+    replace(temporary_path, pickle_path)
+    return catalog
+
+
+@cache
+def _load_process_catalog() -> ApiCatalog:
+    from .api_introspect import build_installed_catalog
+
+    return build_installed_catalog() or load_catalog()
+
+
+def get_catalog() -> ApiCatalog:
+    """
+    Returns the process-wide API catalog, loading it on first use.
+
+    The catalog is generated from the installed manim when it is available, so it
+    matches the version that renders the scene; otherwise the bundled reference is used.
+    Loading can take seconds (it may parse every manim module, though it never imports
+    manim), so async code should call this with `asyncio.to_thread`; concurrent first
+    calls load it once.
+    """
+    with _catalog_lock:
+        return _load_process_catalog()
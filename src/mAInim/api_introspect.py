@@ -0,0 +1,288 @@
+"""
+Generates the API catalog from the installed manim package.
+
+Every module listed in the bundled API reference is parsed with `ast` (manim
+itself is never imported) and the result is cached per module on disk, keyed
+by the manim version and the module file's mtime and size. Only modules whose
+files changed are parsed again, in parallel across a process pool. The pool
+spawns its workers, as the catalog is usually built from a worker thread of a
+multithreaded process, where forking can deadlock.
+
+The names `from manim import *` provides are resolved the same way, by
+following the star imports of manim's `__init__` to the `__all__` of every
+module they import, and cached keyed by the `__init__` file.
+"""
+
+from hashlib import sha256
+from importlib.util import find_spec
+from os import cpu_count, replace, stat
+from os.path import dirname, exists, isdir, join
+
+from typing import Any, Dict, FrozenSet, Iterator, List, Set, Tuple
+
+import ast
+import pickle
+
+from .api_catalog import (
+    CATALOG_FORMAT,
+    ApiCatalog,
+    ApiClass,
+    ApiFunction,
+    ApiModule,
+    load_catalog,
+)
+from .paths import cache_dir
+
+# Below this many stale modules, parsing inline is faster than starting a pool.
+MIN_PARALLEL_MODULES: int = 8
+
+# Methods that are kept even though they start with an underscore.
+PUBLIC_DUNDERS: Tuple[str, ...] = ("__init__",)
+
+# Decorators that make a method a property, and the accessors of an existing one.
+PROPERTY_DECORATORS: Tuple[str, ...] = ("property", "cached_property")
+PROPERTY_ACCESSORS: Tuple[str, ...] = ("getter", "setter", "deleter")
+
+FileKey = Tuple[int, int]
+
+
+def find_manim() -> Tuple[str, str] | None:
+    """
+    Returns the directory containing the installed `manim` package and its version,
+    or None when manim is not installed.
+    """
+    # importlib.metadata is slow to import, so it is only needed once manim was found.
+    try:
+        spec = find_spec("manim")
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None:
+        return None
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        manim_version: str = version("manim")
+    except PackageNotFoundError:
+        return None
+    return dirname(dirname(spec.origin)), manim_version
+
+
+def _is_public(name: str) -> bool:
+    return not name.startswith("_") or name in PUBLIC_DUNDERS
+
+
+def _property_decorator(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
+    for decorator in node.decorator_list:
+        name: str = ast.unparse(decorator)
+        if name.rpartition(".")[2] in PROPERTY_DECORATORS or (
+            isinstance(decorator, ast.Attribute) and decorator.attr in PROPERTY_ACCESSORS
+        ):
+            return f"@{name}"
+    return ""
+
+
+def _signature(node: ast.FunctionDef | ast.AsyncFunctionDef) -> ApiFunction:
+    returns: str = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+    prefix: str = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    return ApiFunction(
+        node.name,
+        f"{prefix} {node.name}({ast.unparse(node.args)}){returns}:",
+        _property_decorator(node),
+    )
+
+
+def introspect_source(source: str, module_path: str) -> ApiModule:
+    """
+    Extracts the public module-level functions and classes (with their methods) from `source`.
+    """
+    module: ApiModule = ApiModule(module_path)
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_public(node.name):
+            module.functions.append(_signature(node))
+        elif isinstance(node, ast.ClassDef) and _is_public(node.name):
+            module.classes[node.name] = ApiClass(
+                node.name,
+                tuple(ast.unparse(base) for base in node.bases),
+                [
+                    _signature(child)
+                    for child in node.body
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+                    and _is_public(child.name)
+                ],
+            )
+    return module
+
+
+def _top_level(body: List[ast.stmt]) -> Iterator[ast.stmt]:
+    """
+    Yields the module-level statements, including those in `if` and `try` blocks.
+    """
+    for node in body:
+        yield node
+        if isinstance(node, ast.If):
+            yield from _top_level(node.body + node.orelse)
+        elif isinstance(node, ast.Try):
+            yield from _top_level(
+                node.body + node.orelse + node.finalbody
+                + [child for handler in node.handlers for child in handler.body]
+            )
+
+
+def _resolve_import(file_path: str, level: int, module: str | None) -> str | None:
+    """
+    Returns the file a relative import in `file_path` refers to, if it exists.
+    """
+    base: str = dirname(file_path)
+    for _ in range(level - 1):
+        base = dirname(base)
+    target: str = join(base, *module.split(".")) if module else base
+    if isdir(target):
+        target = join(target, "__init__.py")
+    else:
+        target += ".py"
+    return target if exists(target) else None
+
+
+def star_exports(file_path: str, seen: Set[str] | None = None) -> FrozenSet[str]:
+    """
+    Returns the public names `from <module> import *` provides for the module at
+    `file_path`: its `__all__` if it declares one, else its public module-level
+    names, following relative star imports.
+    """
+    seen = seen if seen is not None else set()
+    if file_path in seen:
+        return frozenset()
+    seen.add(file_path)
+    with open(file_path, encoding="utf-8") as f:
+        tree: ast.Module = ast.parse(f.read())
+
+    names: Set[str] = set()
+    for node in _top_level(tree.body):
+        targets: List[ast.expr] = []
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        if (
+            any(isinstance(target, ast.Name) and target.id == "__all__" for target in targets)
+            and isinstance(node.value, (ast.List, ast.Tuple))
+        ):
+            return frozenset(
+                element.value
+                for element in node.value.elts
+                if isinstance(element, ast.Constant) and isinstance(element.value, str)
+            )
+        names |= {target.id for target in targets if isinstance(target, ast.Name)}
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.Import):
+            names |= {alias.asname or alias.name.split(".")[0] for alias in node.names}
+        elif isinstance(node, ast.ImportFrom):
+            if node.names[0].name != "*":
+                names |= {alias.asname or alias.name for alias in node.names}
+            elif node.level:
+                imported: str | None = _resolve_import(file_path, node.level, node.module)
+                if imported is not None:
+                    names |= star_exports(imported, seen)
+    return frozenset(name for name in names if not name.startswith("_"))
+
+
+def _file_key(file_path: str) -> FileKey:
+    info = stat(file_path)
+    return info.st_mtime_ns, info.st_size
+
+
+def _introspect_file(job: Tuple[str, str]) -> Tuple[str, FileKey, ApiModule]:
+    """
+    Process pool entry point: parses one module file.
+    """
+    file_path, module_path = job
+    key: FileKey = _file_key(file_path)
+    with open(file_path, encoding="utf-8") as f:
+        return module_path, key, introspect_source(f.read(), module_path)
+
+
+def _cache_path(directory: str, module_path: str) -> str:
+    return join(directory, module_path.replace("/", ".") + ".pickle")
+
+
+def _load_cached(path: str, key: FileKey) -> Any:
+    if not exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            cached_key, value = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError, ImportError, ValueError):
+        return None
+    return value if cached_key == key else None
+
+
+def _store(path: str, key: FileKey, value: ApiModule | FrozenSet[str]) -> None:
+    temporary_path: str = f"{path}.tmp"
+    with open(temporary_path, "wb") as f:
+        pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    replace(temporary_path, path)
+
+
+def build_installed_catalog(
+    module_paths: List[str] | None = None, max_workers: int | None = None
+) -> ApiCatalog | None:
+    """
+    Builds the catalog for the installed manim, reusing every cached module whose file is unchanged.
+
+    Returns None when manim is not installed.
+    """
+    found: Tuple[str, str] | None = find_manim()
+    if found is None:
+        return None
+    site_dir, manim_version = found
+
+    if module_paths is None:
+        module_paths = list(load_catalog().modules)
+
+    directory: str = cache_dir("introspected", f"v{CATALOG_FORMAT}", manim_version)
+    modules: Dict[str, ApiModule] = {}
+    stale: List[Tuple[str, str]] = []
+    for module_path in module_paths:
+        file_path: str = join(site_dir, module_path)
+        if not exists(file_path):
+            continue  # The module was removed or moved in this manim version.
+        cached: ApiModule | None = _load_cached(
+            _cache_path(directory, module_path), _file_key(file_path)
+        )
+        if cached is None:
+            stale.append((file_path, module_path))
+        else:
+            modules[module_path] = cached
+
+    if stale:
+        print(f"Introspecting {len(stale)} manim module(s)...")
+        if len(stale) < MIN_PARALLEL_MODULES:
+            results = map(_introspect_file, stale)
+        else:
+            # Only imported here: the pool and multiprocessing cost tens of milliseconds.
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import get_context
+
+            with ProcessPoolExecutor(
+                max_workers=max_workers or cpu_count(), mp_context=get_context("spawn")
+            ) as pool:
+                results = list(pool.map(_introspect_file, stale, chunksize=4))
+        for module_path, key, module in results:
+            _store(_cache_path(directory, module_path), key, module)
+            modules[module_path] = module
+
+    # Keep the order of `module_paths` so the rendered reference is stable.
+    ordered: Dict[str, ApiModule] = {
+        module_path: modules[module_path] for module_path in module_paths if module_path in modules
+    }
+    init_path: str = join(site_dir, "manim", "__init__.py")
+    exports_path: str = join(directory, "exports.pickle")
+    exports: FrozenSet[str] | None = _load_cached(exports_path, _file_key(init_path))
+    if exports is None:
+        exports = star_exports(init_path)
+        _store(exports_path, _file_key(init_path), exports)
+
+    catalog: ApiCatalog = ApiCatalog(ordered, "", manim_version, exports)
+    catalog.version = sha256(f"{manim_version}\n{catalog.text}".encode()).hexdigest()[:16]
+    return catalog
@@ -0,0 +1,217 @@
+"""
+Selects the parts of the Manim API reference that are relevant to a prompt.
+
+The API reference is split into one section per class (plus one section per
+file for its module-level functions) and indexed with BM25, so only the top
+ranked sections have to be sent to the model instead of the whole dump.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import log
+
+from typing import Dict, Iterable, List, Tuple
+
+import re
+
+from .api_catalog import BLOCK_SEPARATOR, FILE_HEADER, FILE_SEPARATOR
+
+# Sections that are needed for almost any scene, regardless of the prompt.
+PINNED_SECTIONS: Tuple[str, ...] = ("Scene", "Animation")
+
+# Rough characters-per-token ratio used to estimate the size of a section.
+CHARS_PER_TOKEN: int = 4
+
+STOP_WORDS: frozenset = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "cool", "create",
+        "for", "from", "in", "into", "is", "it", "make", "of", "on", "or",
+        "show", "that", "the", "then", "this", "to", "with",
+    }
+)
+
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9]*")
+_CAMEL_CASE_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+@dataclass(frozen=True)
+class ApiSection:
+    """
+    A single class (or the module-level functions of a file) from the API reference.
+    """
+
+    file: str
+    title: str
+    text: str
+
+    @property
+    def estimated_tokens(self) -> int:
+        return len(self.text) // CHARS_PER_TOKEN + 1
+
+
+def _stem(term: str) -> str:
+    """
+    Strips a plural "s" so that e.g. "circles" matches `Circle`.
+    """
+    if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+        return term[:-1]
+    return term
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into lowercase search terms, breaking up snake_case and CamelCase identifiers.
+    """
+    tokens: List[str] = []
+    for identifier in _IDENTIFIER_PATTERN.findall(text):
+        parts: List[str] = _CAMEL_CASE_PATTERN.findall(identifier)
+        if len(parts) > 1:
+            tokens.append(_stem(identifier.lower()))
+        for part in parts:
+            part = part.lower()
+            if len(part) > 1 and part not in STOP_WORDS:
+                tokens.append(_stem(part))
+    return tokens
+
+
+def split_api_sections(api_text: str) -> List[ApiSection]:
+    """
+    Splits the API reference into its per-class and per-file sections.
+    """
+    sections: List[ApiSection] = []
+    for file_chunk in api_text.split(FILE_SEPARATOR):
+        file_chunk = file_chunk.strip()
+        if not file_chunk.startswith(FILE_HEADER):
+            continue
+
+        header, _, rest = file_chunk.partition("\n")
+        file_name: str = header[len(FILE_HEADER) :].strip()
+
+        functions: List[str] = []
+        for block in rest.split(BLOCK_SEPARATOR):
+            block = block.strip()
+            if not block:
+                continue
+            if block.startswith("class "):
+                class_name: str = re.split(r"[(:]", block[len("class ") :], 1)[0]
+                sections.append(ApiSection(file_name, class_name.strip(), block))
+            else:
+                functions.append(block)
+
+        if functions:
+            sections.append(ApiSection(file_name, file_name, "\n".join(functions)))
+
+    return sections
+
+
+@dataclass
+class BM25Index:
+    """
+    An in-memory Okapi BM25 index over API sections.
+    """
+
+    sections: List[ApiSection]
+    k1: float = 1.5
+    b: float = 0.75
+    _term_frequencies: List[Counter] = field(default_factory=list, init=False)
+    _document_lengths: List[int] = field(default_factory=list, init=False)
+    _idf: Dict[str, float] = field(default_factory=dict, init=False)
+    _average_length: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        document_frequencies: Counter = Counter()
+        for section in self.sections:
+            # The class name is repeated so that name matches outrank mentions in signatures.
+            terms: List[str] = tokenize(section.text) + tokenize(section.title) * 3
+            frequencies: Counter = Counter(terms)
+            self._term_frequencies.append(frequencies)
+            self._document_lengths.append(len(terms))
+            document_frequencies.update(frequencies.keys())
+
+        count: int = len(self.sections)
+        self._average_length = sum(self._document_lengths) / max(count, 1)
+        self._idf = {
+            term: log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequencies.items()
+        }
+
+    def score(self, query_terms: Iterable[str], index: int) -> float:
+        frequencies: Counter = self._term_frequencies[index]
+        length_norm: float = 1 - self.b + self.b * (
+            self._document_lengths[index] / self._average_length
+        )
+        total: float = 0.0
+        for term in query_terms:
+            frequency: int = frequencies.get(term, 0)
+            if frequency:
+                total += self._idf[term] * (
+                    frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+                )
+        return total
+
+    def search(self, query: str, top_k: int) -> List[Tuple[ApiSection, float]]:
+        """
+        Returns up to `top_k` sections with a positive score, best first.
+        """
+        query_terms: List[str] = list(dict.fromkeys(tokenize(query)))
+        scored: List[Tuple[float, int]] = [
+            (self.score(query_terms, index), index) for index in range(len(self.sections))
+        ]
+        scored = [item for item in scored if item[0] > 0]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(self.sections[index], score) for score, index in scored[:top_k]]
+
+
+@lru_cache(maxsize=4)
+def build_index(api_text: str) -> BM25Index:
+    """
+    Builds (once per API reference) the BM25 index used by `select_api_sections`.
+    """
+    return BM25Index(split_api_sections(api_text))
+
+
+def render_sections(sections: Iterable[ApiSection]) -> str:
+    """
+    Renders sections back into the same layout as the full API reference, grouped by file.
+    """
+    by_file: Dict[str, List[ApiSection]] = {}
+    for section in sections:
+        by_file.setdefault(section.file, []).append(section)
+
+    chunks: List[str] = []
+    for file_name, file_sections in by_file.items():
+        chunks.append(f"\n{FILE_SEPARATOR}\n\n{FILE_HEADER}{file_name}\n")
+        for section in file_sections:
+            chunks.append(f"{BLOCK_SEPARATOR}\n\n{section.text}\n{BLOCK_SEPARATOR}\n")
+    return "\n".join(chunks)
+
+
+def select_api_sections(
+    prompt: str,
+    api_text: str,
+    top_k: int = 12,
+    token_budget: int = 8000,
+    pinned_titles: Iterable[str] = PINNED_SECTIONS,
+) -> str:
+    """
+    Returns the pinned sections plus the `top_k` sections most relevant to `prompt`,
+    stopping before the estimated size exceeds `token_budget`.
+    """
+    index: BM25Index = build_index(api_text)
+
+    pinned_titles = set(pinned_titles)
+    pinned: List[ApiSection] = [
+        section for section in index.sections if section.title in pinned_titles
+    ]
+    ranked: List[ApiSection] = [section for section, _ in index.search(prompt, top_k)]
+
+    selected: List[ApiSection] = []
+    used_tokens: int = 0
+    for section in dict.fromkeys([*pinned, *ranked]):
+        if used_tokens + section.estimated_tokens > token_budget:
+            continue
+        selected.append(section)
+        used_tokens += section.estimated_tokens
+
+    return render_sections(selected)
@@ -0,0 +1,97 @@
+"""
+Extracts the finalized code block from a model response.
+
+The model is asked to put `CODE_TOKEN` before its final code, usually followed
+by a fenced block. `extract_code` handles a complete response, while
+`IncrementalCodeExtractor` detects the same boundaries as a response streams in,
+so work on the code can start before the model has finished talking.
+"""
+
+from dataclasses import dataclass, field
+
+from typing import List
+
+from .prompts import CODE_TOKEN
+
+FENCE: str = "```"
+
+
+def extract_code(response: str) -> str:
+    """
+    Returns the code after the last `CODE_TOKEN`: the body of the first fenced block
+    after it, up to the fence that closes it (or the end of an unclosed block), or
+    all of the text after the token if there is no fence.
+
+    Anything after the closing fence is not code, so this returns the same block as
+    `IncrementalCodeExtractor`.
+    """
+    tail: str = response[response.rfind(CODE_TOKEN) + len(CODE_TOKEN) :]
+    opening: int = tail.find(FENCE)
+    if opening == -1:
+        return tail
+    body_start: int = tail.find("\n", opening)
+    if body_start == -1:
+        return ""  # Only the opening fence (and its language) so far.
+    closing: int = tail.find(FENCE, body_start)
+    return tail[body_start + 1 : closing] if closing != -1 else tail[body_start + 1 :]
+
+
+@dataclass
+class IncrementalCodeExtractor:
+    """
+    Feeds on response chunks and reports each fenced code block that closes after a `CODE_TOKEN`.
+
+    A block reported by `feed` is a candidate: if the model emits another
+    `CODE_TOKEN` later, a newer candidate follows. `finish` returns the block
+    after the last `CODE_TOKEN`, falling back to `extract_code` when it was never closed.
+    """
+
+    _text: str = ""
+    _candidate_token_end: int = -1
+    _token_end: int = -1
+    _scan_from: int = 0
+    candidates: List[str] = field(default_factory=list)
+
+    def feed(self, chunk: str) -> str | None:
+        """
+        Adds a chunk and returns a newly completed code block, if this chunk closed one.
+        """
+        self._text += chunk
+
+        # Only re-scan the tail that could contain a token or fence split across chunks.
+        start: int = max(self._scan_from - max(len(CODE_TOKEN), len(FENCE)), 0)
+        token_index: int = self._text.rfind(CODE_TOKEN, start)
+        if token_index != -1 and token_index + len(CODE_TOKEN) > self._token_end:
+            self._token_end = token_index + len(CODE_TOKEN)
+        self._scan_from = len(self._text)
+
+        if self._token_end == -1 or self._candidate_token_end == self._token_end:
+            return None  # No token yet, or the block after this token was already reported.
+
+        tail: str = self._text[self._token_end :]
+        opening: int = tail.find(FENCE)
+        if opening == -1:
+            return None
+        body_start: int = tail.find("\n", opening)
+        if body_start == -1:
+            return None
+        closing: int = tail.find(FENCE, body_start)
+        if closing == -1:
+            return None
+
+        candidate: str = extract_code(self._text[: self._token_end + closing + len(FENCE)])
+        self.candidates.append(candidate)
+        self._candidate_token_end = self._token_end
+        return candidate
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def finish(self) -> str:
+        """
+        Returns the final code once the response is complete.
+        """
+        if self.candidates and self._candidate_token_end == self._token_end:
+            return self.candidates[-1]
+        return extract_code(self._text)
@@ -11,10 +11,32 @@ import libcst.matchers as m
 from libcst.display import dump
 from libcst import RemoveFromParent
 
-from typing import Dict, Tuple, Self, Union
+from typing import Dict, List, Set, Tuple, Self, Union
 import wave as w
 from os import getcwd
 
+from .transform_pipeline import TransformPass, TransformPipeline, enabled_passes, register_pass
+
+# CST nodes are immutable, so the injected statements are parsed once and shared.
+OPENGL_SURFACE_IMPORT: cst.SimpleStatementLine = cst.parse_statement(
+    "from manim.mobject.opengl.opengl_three_dimensions import OpenGLSurface"
+)
+INTERACTIVE_EMBED: cst.SimpleStatementLine = cst.parse_statement("self.interactive_embed()")
+
+# The manim classes a renderable scene derives from.
+SCENE_BASES: Tuple[str, ...] = (
+    "Scene",
+    "ThreeDScene",
+    "SpecialThreeDScene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "VectorScene",
+    "LinearTransformationScene",
+)
+
+# Scene methods that each count as one animation (manim's `num_plays`).
+ANIMATION_METHODS: Tuple[str, ...] = ("play", "wait", "pause", "wait_until")
+
 
 def get_audio_file_duration(sound_file_path: str) -> float:
     """
@@ -27,52 +49,51 @@ def get_audio_file_duration(sound_file_path: str) -> float:
         return round(duration, 2)
 
 
-class GeminiTransformer(cst.CSTTransformer):
+@register_pass
+class RemoveRunTimePass(TransformPass):
     """
-    A class to add code to a Gemini generated code file.
+    Removes run_time=[value] from function calls for run_time=[sound_file_length] to be added later.
     """
 
-    def __init__(
-        self: Self,
-        sound_indicator_nodes: Dict[str, Tuple[str, float]],
-    ) -> None:
-        self.sound_indicator_nodes: Dict[str, Tuple[str, float]] = sound_indicator_nodes
+    name = "remove_run_time"
 
-    def leave_Module(self, _: cst.Module, updated_node: cst.Module) -> cst.Module:
-        if "OpenGLSurface" not in updated_node.code:
-            return updated_node
+    def leave_Arg(
+        self: Self, original_node: cst.Arg, updated_node: cst.Arg
+    ) -> Union[cst.Arg, cst.RemovalSentinel]:
+        # Equivalent to matching `m.Arg(value=m.OneOf(m.Integer(), m.Float()), keyword=m.Name("run_time"))`,
+        # without building the matcher for every argument in the module.
+        if (
+            original_node.keyword is not None
+            and original_node.keyword.value == "run_time"
+            and isinstance(original_node.value, (cst.Integer, cst.Float))
+        ):
+            return RemoveFromParent()
+        return updated_node
 
-        import_statement: cst.Import = cst.parse_statement(
-            "from manim.mobject.opengl.opengl_three_dimensions import OpenGLSurface"
-        )
-        new_body = [import_statement, *list(updated_node.body)]
-        return updated_node.with_changes(body=new_body)
 
-    def leave_FunctionDef(
-        self: Self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
-    ) -> cst.FunctionDef:
-        """
-        This function adds `self.interactive_embed()` to the end of the construct function.
-        """
-        if original_node.name.value != "construct":
-            return super().leave_FunctionDef(original_node, updated_node)
+@register_pass
+class SoundEffectsPass(TransformPass):
+    """
+    Adds `self.add_sound(...)` after certain Manim function calls, such as `Create()` or `FadeOut()`.
 
-        interactive_code: cst.SimpleStatementLine = cst.parse_statement(
-            "self.interactive_embed()"
-        )
-        new_body: cst.IndentedBlock = cst.IndentedBlock(
-            body=[*updated_node.body.body, interactive_code]
-        )
-        return updated_node.with_changes(body=new_body)
+    Not finished yet, so it is disabled by default.
+    """
+
+    name = "sound_effects"
+    requires = ("remove_run_time",)
+    enabled_by_default = False
+
+    sound_indicator_nodes: Dict[str, Tuple[str, float]] = {
+        "Create": ("click.wav", 1),
+        "Rotate": ("click.wav", 1),
+        "FadeOut": ("click.wav", 1),
+    }
 
     def leave_SimpleStatementLine(
         self: Self,
         original_node: cst.SimpleStatementLine,
         updated_node: cst.SimpleStatementLine,
     ) -> Union[cst.SimpleStatementLine, cst.FlattenSentinel]:
-        """
-        This function adds `self.add_sound(...)` after certain Manim function calls, such as `Create()` or `FadeOut()`.
-        """
         # for child in original_node.children:
         #     # This for loop matches specific nodes to add `self.add_sound(...)` after lines containing
         #     # certain Manim function calls.
@@ -125,43 +146,235 @@ class GeminiTransformer(cst.CSTTransformer):
         #             )
         #             return cst.FlattenSentinel([sound_code, updated_node])
 
-        return super().leave_SimpleStatementLine(original_node, updated_node)
+        return updated_node
 
-    def leave_Arg(
-        self: Self, original_node: cst.Arg, updated_node: cst.Arg
-    ) -> Union[cst.Arg, cst.RemovalSentinel]:
-        """
-        Removes run_time=[value] from function calls for run_time=[sound_file_length] to be added later.
-        """
-        if m.matches(
-            original_node,
-            m.Arg(
-                value=m.OneOf(m.Integer(), m.Float()),
-                keyword=m.Name(value="run_time"),
-            ),
+
+@register_pass
+class OpenGLImportPass(TransformPass):
+    """
+    Imports `OpenGLSurface` when the code uses it without importing it.
+
+    The names used and imported are collected during the walk, so the module is
+    never turned back into source to inspect it.
+    """
+
+    name = "opengl_import"
+
+    def __init__(self: Self) -> None:
+        super().__init__()
+        self.names_used: Set[str] = set()
+        self.imported_names: Set[str] = set()
+
+    def visit_Name(self: Self, node: cst.Name) -> None:
+        self.names_used.add(node.value)
+
+    def visit_Import(self: Self, node: cst.Import) -> bool:
+        for alias in node.names:
+            self.imported_names.add(alias.evaluated_alias or alias.evaluated_name)
+        return False  # Imported names are not uses.
+
+    def visit_ImportFrom(self: Self, node: cst.ImportFrom) -> bool:
+        if isinstance(node.names, cst.ImportStar):
+            return False
+        for alias in node.names:
+            self.imported_names.add(alias.evaluated_alias or alias.evaluated_name)
+        return False
+
+    def leave_Module(self: Self, _: cst.Module, updated_node: cst.Module) -> cst.Module:
+        if "OpenGLSurface" not in self.names_used or "OpenGLSurface" in self.imported_names:
+            return updated_node
+
+        return updated_node.with_changes(body=[OPENGL_SURFACE_IMPORT, *updated_node.body])
+
+
+@register_pass
+class InteractiveEmbedPass(TransformPass):
+    """
+    Adds `self.interactive_embed()` to the end of the construct function.
+    """
+
+    name = "interactive_embed"
+
+    def leave_FunctionDef(
+        self: Self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
+    ) -> cst.FunctionDef:
+        if original_node.name.value != "construct":
+            return updated_node
+
+        new_body: cst.IndentedBlock = cst.IndentedBlock(
+            body=[*updated_node.body.body, INTERACTIVE_EMBED]
+        )
+        return updated_node.with_changes(body=new_body)
+
+
+def find_scene_names(module: cst.Module) -> List[str]:
+    """
+    Returns the names of the module's renderable scenes, in source order: the top-level
+    classes deriving from a manim scene class (directly or through other classes of
+    the module) that have a `construct` method of their own or from such a class.
+    """
+    classes: Dict[str, cst.ClassDef] = {
+        statement.name.value: statement
+        for statement in module.body
+        if isinstance(statement, cst.ClassDef)
+    }
+
+    def bases(node: cst.ClassDef) -> List[str]:
+        names: List[str] = []
+        for base in node.bases:
+            value = base.value
+            if isinstance(value, cst.Attribute):  # `manim.Scene`
+                value = value.attr
+            if isinstance(value, cst.Name):
+                names.append(value.value)
+        return names
+
+    def is_scene(name: str, seen: Set[str]) -> bool:
+        if name not in classes:
+            return name in SCENE_BASES
+        if name in seen:
+            return False
+        seen.add(name)
+        return any(is_scene(base, seen) for base in bases(classes[name]))
+
+    def has_construct(name: str, seen: Set[str]) -> bool:
+        if name not in classes or name in seen:
+            return False
+        seen.add(name)
+        return any(
+            isinstance(statement, cst.FunctionDef) and statement.name.value == "construct"
+            for statement in classes[name].body.body
+        ) or any(has_construct(base, seen) for base in bases(classes[name]))
+
+    return [name for name in classes if is_scene(name, set()) and has_construct(name, set())]
+
+
+class _AnimationCounter(cst.CSTVisitor):
+    """
+    Counts the animations played by a statement, noting those it cannot count.
+    """
+
+    def __init__(self, local_methods: Set[str]) -> None:
+        super().__init__()
+        self.local_methods: Set[str] = local_methods
+        self.calls: int = 0
+        self.dynamic: bool = False
+        self._functions: int = 0
+
+    def visit_Lambda(self, node: cst.Lambda) -> None:
+        self._functions += 1
+
+    def leave_Lambda(self, original_node: cst.Lambda) -> None:
+        self._functions -= 1
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
+        self._functions += 1
+
+    def leave_FunctionDef(self, original_node: cst.FunctionDef) -> None:
+        self._functions -= 1
+
+    def visit_Call(self, node: cst.Call) -> None:
+        if any(m.matches(arg.value, m.Name("self")) for arg in node.args):
+            self.dynamic = True  # A helper that is given the scene may play anything.
+        if not m.matches(node.func, m.Attribute(value=m.Name("self"))):
+            return
+        method: str = cst.ensure_type(node.func, cst.Attribute).attr.value
+        if method in self.local_methods:
+            self.dynamic = True
+        elif method in ANIMATION_METHODS:
+            if self._functions:
+                self.dynamic = True
+            self.calls += 1
+
+
+def count_animations(module: cst.Module, scene_name: str) -> int | None:
+    """
+    Returns how many animations (`self.play` and `self.wait` calls) the scene's own
+    `construct` method plays, or None if that cannot be told without running it:
+    when an animation is played in a loop, branch or nested function, or `construct`
+    calls a method of the module's classes or passes the scene to a helper.
+    """
+    classes: List[cst.ClassDef] = [
+        statement for statement in module.body if isinstance(statement, cst.ClassDef)
+    ]
+    local_methods: Set[str] = {
+        statement.name.value
+        for node in classes
+        for statement in node.body.body
+        if isinstance(statement, cst.FunctionDef)
+    }
+    scene: cst.ClassDef | None = next(
+        (node for node in classes if node.name.value == scene_name), None
+    )
+    construct: cst.FunctionDef | None = next(
+        (
+            statement
+            for statement in (scene.body.body if scene is not None else ())
+            if isinstance(statement, cst.FunctionDef) and statement.name.value == "construct"
+        ),
+        None,
+    )
+    if construct is None:
+        return None
+
+    animations: int = 0
+    for statement in construct.body.body:
+        counter: _AnimationCounter = _AnimationCounter(local_methods - {"construct"})
+        statement.visit(counter)
+        if counter.dynamic or (
+            counter.calls and isinstance(statement, cst.BaseCompoundStatement)
         ):
-            return RemoveFromParent()
-        return updated_node
+            return None
+        animations += counter.calls
+    return animations
 
 
-def add_interactivity(code: str, path: str = getcwd()) -> None:
+def parse_code(code: str) -> cst.Module | None:
     """
-    Adds interactivity to the generated Gemini code.
+    Parses generated code, returning None if it is not valid Python.
     """
-    code: cst.Module = cst.parse_module(code)
+    try:
+        return cst.parse_module(code)
+    except cst.ParserSyntaxError as e:
+        print(f"Generated code has a syntax error: {e}")
+        return None
+
+
+def add_interactivity(
+    code: str | cst.Module, path: str | None = getcwd(), interactive: bool = True
+) -> Tuple[cst.Module, str]:
+    """
+    Adds interactivity to the generated Gemini code, which may already be parsed,
+    writes it to `path` (unless None) and returns the transformed module with its source.
+
+    The code goes through the enabled transform passes (see `transform_pipeline`),
+    whose timings are printed.
+
+    The source is generated from the module exactly once; callers should reuse the
+    returned string rather than reading `module.code` again.
+
+    With `interactive=False` the code is only cleaned up, without the embed that
+    would block a headless render.
+    """
+    if isinstance(code, str):
+        code = cst.parse_module(code)
 
     # with open("cst_full_debug.txt", "w") as f:
     #     f.write(dump(code))
 
-    sound_indicator_nodes: Dict[str, Tuple[str, int]] = {
-        "Create": ("click.wav", 1),
-        "Rotate": ("click.wav", 1),
-        "FadeOut": ("click.wav", 1),
-    }
-    updated_cst: cst.Module = code.visit(GeminiTransformer(sound_indicator_nodes))
+    pass_names: List[str] = enabled_passes()
+    if not interactive and "interactive_embed" in pass_names:
+        pass_names.remove("interactive_embed")
+    pipeline: TransformPipeline = TransformPipeline(pass_names)
+    updated_cst: cst.Module = pipeline.run(code)
+    print(f"Transform passes: {pipeline.report()}")
+
+    updated_code: str = updated_cst.code
 
-    print(f"Writing to {path}/generated_code.py...")
-    with open(f"{path}/generated_code.py", "w") as f:
-        f.write(updated_cst.code)
+    if path is not None:
+        print(f"Writing to {path}/generated_code.py...")
+        with open(f"{path}/generated_code.py", "w") as f:
+            f.write(updated_code)
 
     print("Finished adding interactivity...")
+    return updated_cst, updated_code
@@ -0,0 +1,239 @@
+"""
+A shared, connection-pooled HTTP client for the code generation backends.
+
+One `AsyncClient` is kept per event loop so every request reuses the same
+keep-alive (HTTP/2 when `h2` is installed) connections. `post_json` and
+`stream_text` add per-attempt timeouts, jittered exponential backoff with
+`asyncio.sleep`, and a per-URL circuit breaker so a failing backend is not hammered.
+Every read of a response is bounded by the attempt timeout as well, so a body
+that stalls fails instead of waiting forever.
+"""
+
+from asyncio import AbstractEventLoop, get_running_loop, sleep, timeout
+from dataclasses import dataclass
+from importlib.util import find_spec
+from json import loads
+from random import uniform
+from time import monotonic
+
+from typing import Any, AsyncIterator, Dict
+from weakref import WeakKeyDictionary
+
+from httpx import AsyncClient, HTTPStatusError, Limits, RequestError, Response, Timeout
+
+# Status codes worth retrying; any other HTTP error is returned to the caller immediately.
+RETRYABLE_STATUS_CODES: frozenset = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+LIMITS: Limits = Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60)
+
+# Clients are bound to the loop they were created on, and dropped with it.
+_clients: WeakKeyDictionary = WeakKeyDictionary()
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the backend's circuit breaker is open.
+    """
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and lets a single trial
+    request through once `reset_timeout` seconds have passed (half-open). Other
+    requests are rejected until the trial succeeds, which closes the breaker, or
+    fails, which opens it again. A trial that has not reported back within
+    `reset_timeout` seconds (e.g. it was cancelled) is presumed lost, and the
+    next request becomes the trial.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    failures: int = 0
+    opened_at: float | None = None
+    trial_started_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None and monotonic() - self.opened_at < self.reset_timeout
+
+    @property
+    def is_half_open(self) -> bool:
+        return self.opened_at is not None and not self.is_open
+
+    def check(self) -> None:
+        """
+        Raises `CircuitOpenError` unless a request may be sent now; while half-open,
+        the request allowed through becomes the trial.
+        """
+        if self.is_open:
+            raise CircuitOpenError(
+                f"Circuit open after {self.failures} failures, retry in "
+                f"{self.reset_timeout - (monotonic() - self.opened_at):.0f}s."
+            )
+        if self.is_half_open:
+            now: float = monotonic()
+            if self.trial_started_at is not None and now - self.trial_started_at < self.reset_timeout:
+                raise CircuitOpenError("Circuit half-open, waiting for the trial request.")
+            self.trial_started_at = now
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = monotonic()
+            self.trial_started_at = None
+
+
+_breakers: Dict[str, CircuitBreaker] = dict()
+
+
+def get_breaker(url: str) -> CircuitBreaker:
+    return _breakers.setdefault(url, CircuitBreaker())
+
+
+def get_client() -> AsyncClient:
+    """
+    Returns the pooled client of the running event loop, creating it on first use.
+    """
+    loop: AbstractEventLoop = get_running_loop()
+    client: AsyncClient | None = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = AsyncClient(http2=find_spec("h2") is not None, limits=LIMITS)
+        _clients[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """
+    Closes the running event loop's pooled client, if any.
+    """
+    client: AsyncClient | None = _clients.pop(get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Full-jitter exponential backoff: a random delay in [0, min(cap, base * 2 ** attempt)].
+    """
+    return uniform(0, min(cap, base * 2**attempt))
+
+
+async def send_with_retries(
+    url: str,
+    payload: Dict[str, Any],
+    max_retries: int = 3,
+    attempt_timeout: float = 120.0,
+    breaker: CircuitBreaker | None = None,
+    stream: bool = False,
+) -> Response:
+    """
+    POSTs `payload` as JSON and returns the first successful response.
+
+    Connection errors, timeouts and retryable status codes are retried up to
+    `max_retries` attempts in total; the last error is raised once they are
+    exhausted. With `stream=True` only the response headers have been read and
+    the caller must close the response; each later read of its body fails with
+    `httpx.ReadTimeout` after `attempt_timeout` seconds without data.
+    """
+    breaker = breaker or get_breaker(url)
+    client: AsyncClient = get_client()
+
+    for attempt in range(max_retries):
+        breaker.check()
+        try:
+            async with timeout(attempt_timeout):
+                request = client.build_request(
+                    "POST", url, json=payload, timeout=Timeout(None, read=attempt_timeout)
+                )
+                response: Response = await client.send(request, stream=stream)
+                if stream and response.is_error:
+                    await response.aread()
+                    await response.aclose()
+            response.raise_for_status()
+        except HTTPStatusError as e:
+            if e.response.status_code not in RETRYABLE_STATUS_CODES:
+                raise
+            error: Exception = e
+        except (RequestError, TimeoutError) as e:
+            error = e
+        else:
+            breaker.record_success()
+            return response
+
+        breaker.record_failure()
+        if attempt == max_retries - 1:
+            raise error
+
+        delay: float = backoff_delay(attempt)
+        print(f"Request failed ({type(error).__name__}), retrying in {delay:.1f}s.")
+        await sleep(delay)
+
+    raise ValueError("max_retries must be at least 1.")
+
+
+async def post_json(
+    url: str,
+    payload: Dict[str, Any],
+    max_retries: int = 3,
+    attempt_timeout: float = 120.0,
+    breaker: CircuitBreaker | None = None,
+) -> Dict[str, Any]:
+    """
+    POSTs `payload` as JSON and returns the decoded JSON response.
+    """
+    response: Response = await send_with_retries(
+        url, payload, max_retries, attempt_timeout, breaker
+    )
+    return response.json()
+
+
+async def stream_text(
+    url: str,
+    payload: Dict[str, Any],
+    max_retries: int = 3,
+    attempt_timeout: float = 120.0,
+    breaker: CircuitBreaker | None = None,
+) -> AsyncIterator[str]:
+    """
+    POSTs `payload` and yields the response text as it arrives.
+
+    A JSON response (from a backend that does not stream) yields its "output"
+    field at once; any other response yields its decoded body chunks. A body
+    that fails or stalls for `attempt_timeout` seconds before its first chunk is
+    requested again, up to `max_retries` times; an error after text was yielded is raised.
+    """
+    breaker = breaker or get_breaker(url)
+    for attempt in range(max_retries):
+        response: Response = await send_with_retries(
+            url, payload, max_retries, attempt_timeout, breaker, stream=True
+        )
+        received: bool = False
+        try:
+            if response.headers.get("content-type", "").startswith("application/json"):
+                body: Dict[str, Any] = loads(await response.aread())
+                if "error" in body:
+                    raise ValueError(f"JSON Error: {body['error']}")
+                received = True
+                yield body.get("output", "")
+            else:
+                async for chunk in response.aiter_text():
+                    received = True
+                    yield chunk
+            return
+        except RequestError as e:
+            if received or attempt == max_retries - 1:
+                raise
+            breaker.record_failure()
+            delay: float = backoff_delay(attempt)
+            print(f"Response body failed ({type(e).__name__}), retrying in {delay:.1f}s.")
+        finally:
+            await response.aclose()
+        await sleep(delay)
+
+    raise ValueError("max_retries must be at least 1.")
@@ -0,0 +1,159 @@
+"""
+An async backend for models served locally by LM Studio.
+
+The LM Studio SDK calls used here are blocking, so they run on a dedicated
+executor owned by the backend instead of on the event loop. The model handle
+is loaded once and kept warm for the lifetime of the process, and the backend
+keeps queue depth and throughput metrics.
+"""
+
+from asyncio import Future, Queue, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from threading import Lock
+from time import perf_counter
+
+from typing import AsyncIterator, Callable, Tuple
+
+import lmstudio as lms
+
+DEFAULT_LOCAL_MODEL: str = "deepseek-coder-v2-lite-instruct"
+
+# What a completion raises when LM Studio is unreachable or the model fails to load or run.
+LOCAL_MODEL_ERRORS: Tuple[type, ...] = (lms.LMStudioError, OSError)
+
+
+@dataclass
+class LocalModelMetrics:
+    queue_depth: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    generated_tokens: int = 0
+    generation_seconds: float = 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        if self.generation_seconds == 0:
+            return 0.0
+        return self.generated_tokens / self.generation_seconds
+
+
+class LocalModelBackend:
+    """
+    A warm LM Studio model handle with completions run on a dedicated executor.
+
+    Up to `parallelism` completions run at once; further prompts wait in the
+    executor's queue, so callers can submit (pipeline) several prompts up front.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_LOCAL_MODEL, parallelism: int = 2) -> None:
+        self.model_name: str = model_name
+        self.metrics: LocalModelMetrics = LocalModelMetrics()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=parallelism, thread_name_prefix="lmstudio"
+        )
+        self._model: lms.LLM | None = None
+        self._preload: Future | None = None
+        self._model_lock: Lock = Lock()
+        self._metrics_lock: Lock = Lock()
+
+    def _get_model(self) -> lms.LLM:
+        with self._model_lock:
+            if self._model is None:
+                print(f"Loading {self.model_name}...")
+                self._model = lms.llm(self.model_name)
+            return self._model
+
+    def _load_quietly(self) -> None:
+        try:
+            self._get_model()
+        except LOCAL_MODEL_ERRORS as e:
+            print(f"Could not preload {self.model_name}: {e!r}")
+
+    def preload(self) -> Future:
+        """
+        Starts loading the model handle on the executor ahead of the first prompt, which
+        waits for the load; returns its future. A failed load is only logged here: the
+        prompts retry it and raise its error.
+        """
+        if self._preload is None:
+            self._preload = get_running_loop().run_in_executor(
+                self._executor, self._load_quietly
+            )
+        return self._preload
+
+    def _run(self, job: Callable[[lms.LLM], int]) -> None:
+        with self._metrics_lock:
+            self.metrics.queue_depth -= 1
+            self.metrics.in_flight += 1
+        start: float = perf_counter()
+        tokens: int = 0
+        try:
+            # Inside the try, so that a model that fails to load counts as a failed job.
+            tokens = job(self._get_model())
+        except Exception:
+            with self._metrics_lock:
+                self.metrics.failed += 1
+            raise
+        else:
+            with self._metrics_lock:
+                self.metrics.completed += 1
+        finally:
+            with self._metrics_lock:
+                self.metrics.in_flight -= 1
+                self.metrics.generated_tokens += tokens
+                self.metrics.generation_seconds += perf_counter() - start
+
+    async def complete(self, prompt: str) -> str:
+        """
+        Returns the full completion for `prompt`.
+        """
+        content: str = ""
+
+        def job(model: lms.LLM) -> int:
+            nonlocal content
+            result: lms.PredictionResult = model.complete(prompt)
+            content = result.content
+            return result.stats.predicted_tokens_count or 0
+
+        with self._metrics_lock:
+            self.metrics.queue_depth += 1
+        await get_running_loop().run_in_executor(self._executor, self._run, job)
+        return content
+
+    async def complete_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Yields the completion for `prompt` fragment by fragment.
+        """
+        loop = get_running_loop()
+        queue: Queue = Queue()
+        done = object()
+
+        def job(model: lms.LLM) -> int:
+            prediction_stream: lms.PredictionStream = model.complete_stream(prompt)
+            for fragment in prediction_stream:
+                loop.call_soon_threadsafe(queue.put_nowait, fragment.content)
+            return prediction_stream.result().stats.predicted_tokens_count or 0
+
+        with self._metrics_lock:
+            self.metrics.queue_depth += 1
+        future = loop.run_in_executor(self._executor, self._run, job)
+        # The future completes after every fragment was queued, and also when the job
+        # fails before streaming (e.g. the model cannot be loaded), which then raises below.
+        future.add_done_callback(lambda _: queue.put_nowait(done))
+        while (content := await queue.get()) is not done:
+            yield content
+        await future
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@cache
+def get_local_backend(model_name: str = DEFAULT_LOCAL_MODEL) -> LocalModelBackend:
+    """
+    Returns the process-wide backend for `model_name`.
+    """
+    return LocalModelBackend(model_name)
@@ -0,0 +1,271 @@
+"""
+Keeps a manim media directory within byte and age quotas.
+
+manim writes the final videos, the partial movie files they are stitched from,
+LaTeX and text SVG caches and images under the media directory of every run,
+so it grows without bound. The janitor periodically scans it in a background
+thread and evicts artifacts, least recently used first:
+
+- every render job directory under `jobs/` (see `mvp.job_video_dir`) is
+  evicted as a whole, its last use being the later of its render cache access
+  and its modification time;
+- loose final videos and images elsewhere are evicted file by file;
+- the Tex and text caches, partial movie files outside job directories and the
+  render cache database are shared by all jobs and are never evicted;
+- a file is counted once however many hard links it has, and Tex files linked
+  from the shared Tex cache (see `tex_cache`) are not counted at all, as
+  evicting them frees nothing;
+- nothing used within the last `hot_seconds` or belonging to a render that is
+  still running (see `in_use`) is evicted.
+
+Artifacts older than `max_age_seconds` are evicted first, then the least
+recently used ones until the directory fits in `max_bytes`. Every scan records
+the disk usage per kind of artifact in `usage`.
+"""
+
+from asyncio import Task, create_task, sleep, to_thread
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cache
+from os import environ, lstat, remove, rmdir, stat_result, walk
+from os.path import isdir, join, relpath
+from shutil import rmtree
+from threading import Lock
+from time import perf_counter, time
+
+from typing import Dict, Iterator, List, Set, Tuple
+
+DEFAULT_MAX_BYTES: int = 2 * 1024 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS: float = 7 * 24 * 60 * 60
+DEFAULT_HOT_SECONDS: float = 60 * 60
+DEFAULT_INTERVAL_SECONDS: float = 60.0
+
+# Directories of caches manim reuses across scenes; at the top level they are shared
+# by all jobs, in job directories they link to the shared Tex cache (see `tex_cache`).
+SHARED_CACHES: Set[str] = {"Tex", "texts"}
+
+
+@dataclass
+class MediaUsage:
+    """
+    Disk usage of a media directory after its last collection, and what the janitor
+    has evicted from it so far.
+    """
+
+    total_bytes: int = 0
+    files: int = 0
+    bytes_by_kind: Dict[str, int] = field(default_factory=dict)
+    evicted: int = 0
+    evicted_bytes: int = 0
+    scanned_at: float = 0.0
+    scan_seconds: float = 0.0
+
+
+@dataclass
+class _Artifact:
+    path: str
+    is_dir: bool
+    files: int = 0
+    last_used: float = 0.0
+    bytes_by_kind: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return sum(self.bytes_by_kind.values())
+
+
+def artifact_kind(relative_path: str) -> str:
+    """
+    Classifies a file of the media directory by its path relative to it.
+    """
+    parts: List[str] = relative_path.split("/")
+    if any(part in SHARED_CACHES for part in parts[:-1]):
+        return "tex"
+    if "partial_movie_files" in parts:
+        return "partial_movies"
+    if parts[0] == "images":
+        return "images"
+    if parts[0] in ("jobs", "videos"):
+        return "videos"
+    return "other"
+
+
+class MediaJanitor:
+    """
+    Evicts artifacts of `media_dir` to keep it within the quotas (see the module docstring).
+    """
+
+    def __init__(
+        self,
+        media_dir: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        hot_seconds: float = DEFAULT_HOT_SECONDS,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+    ) -> None:
+        self.media_dir: str = media_dir
+        self.max_bytes: int = max_bytes
+        self.max_age_seconds: float = max_age_seconds
+        self.hot_seconds: float = hot_seconds
+        self.interval_seconds: float = interval_seconds
+        self.usage: MediaUsage = MediaUsage()
+        self._in_use: Dict[str, int] = {}
+        self._lock: Lock = Lock()
+        self._task: Task | None = None
+
+    @contextmanager
+    def in_use(self, path: str) -> Iterator[None]:
+        """
+        Protects the job directory or file at `path` from eviction while the block runs.
+        """
+        with self._lock:
+            self._in_use[path] = self._in_use.get(path, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_use[path] -= 1
+                if not self._in_use[path]:
+                    del self._in_use[path]
+
+    def start(self) -> None:
+        """
+        Starts collecting every `interval_seconds` in the background of the running event loop.
+        """
+        if self._task is None or self._task.done():
+            self._task = create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await to_thread(self.collect)
+            except Exception as e:
+                print(f"Media janitor error: {e!r}")
+            await sleep(self.interval_seconds)
+
+    def _scan(self, last_access: Dict[str, float]) -> List[_Artifact]:
+        """
+        Records the disk usage and returns the evictable artifacts.
+        """
+        usage: MediaUsage = MediaUsage(
+            evicted=self.usage.evicted, evicted_bytes=self.usage.evicted_bytes
+        )
+        jobs: Dict[str, _Artifact] = {}
+        artifacts: List[_Artifact] = []
+        seen: Set[Tuple[int, int]] = set()
+        for root, _, files in walk(self.media_dir):
+            for file in files:
+                path: str = join(root, file)
+                try:
+                    stat: stat_result = lstat(path)
+                except OSError:
+                    continue  # Deleted while walking.
+                relative: str = relpath(path, self.media_dir)
+                kind: str = artifact_kind(relative)
+                modified: float = stat.st_mtime
+                size: int = stat.st_size
+                if (stat.st_dev, stat.st_ino) in seen or (kind == "tex" and stat.st_nlink > 1):
+                    size = 0  # Already counted, or held by the shared Tex cache too.
+                seen.add((stat.st_dev, stat.st_ino))
+                usage.total_bytes += size
+                usage.files += 1
+                usage.bytes_by_kind[kind] = usage.bytes_by_kind.get(kind, 0) + size
+
+                parts: List[str] = relative.split("/")
+                last_used: float = max(modified, last_access.get(path, 0.0))
+                if parts[0] == "jobs" and len(parts) > 2:
+                    job_dir: str = join(self.media_dir, "jobs", parts[1])
+                    job: _Artifact = jobs.setdefault(job_dir, _Artifact(job_dir, True))
+                    job.files += 1
+                    job.bytes_by_kind[kind] = job.bytes_by_kind.get(kind, 0) + size
+                    job.last_used = max(job.last_used, last_used)
+                elif kind in ("videos", "images"):
+                    artifacts.append(_Artifact(path, False, 1, last_used, {kind: size}))
+
+        usage.scanned_at = time()
+        self.usage = usage
+        artifacts.extend(jobs.values())
+        return artifacts
+
+    def collect(self, last_access: Dict[str, float] | None = None) -> MediaUsage:
+        """
+        Scans the media directory once and evicts what exceeds the quotas.
+
+        `last_access` maps video paths to when they were last served from the render
+        cache; by default it is read from the directory's render cache.
+        """
+        if not isdir(self.media_dir):
+            return self.usage  # Removed along with its job; nothing to collect.
+        if last_access is None:
+            from .render_cache import get_render_cache
+
+            last_access = get_render_cache(self.media_dir).last_access()
+
+        start: float = perf_counter()
+        artifacts: List[_Artifact] = self._scan(last_access)
+        now: float = time()
+        usage: MediaUsage = self.usage
+        total: int = usage.total_bytes
+        evicted: int = 0
+        evicted_bytes: int = 0
+        for artifact in sorted(artifacts, key=lambda artifact: artifact.last_used):
+            expired: bool = artifact.last_used < now - self.max_age_seconds
+            hot: bool = artifact.last_used >= now - self.hot_seconds
+            if not expired and (total <= self.max_bytes or hot):
+                break  # Everything after this one is more recently used.
+            with self._lock:
+                if self._busy(artifact.path):
+                    continue
+                try:
+                    if artifact.is_dir:
+                        rmtree(artifact.path)
+                    else:
+                        remove(artifact.path)
+                except OSError:
+                    continue
+            total -= artifact.size
+            evicted += 1
+            evicted_bytes += artifact.size
+            usage.files -= artifact.files
+            for kind, size in artifact.bytes_by_kind.items():
+                usage.bytes_by_kind[kind] -= size
+
+        if evicted:
+            self._remove_empty_dirs()
+            print(
+                f"Evicted {evicted} media artifact(s), {evicted_bytes / 1024 / 1024:.1f} MiB, "
+                f"from {self.media_dir}."
+            )
+        usage.total_bytes = total
+        usage.evicted += evicted
+        usage.evicted_bytes += evicted_bytes
+        usage.scan_seconds = perf_counter() - start
+        return usage
+
+    def _busy(self, path: str) -> bool:
+        return any(
+            path == busy or path.startswith(busy + "/") or busy.startswith(path + "/")
+            for busy in self._in_use
+        )
+
+    def _remove_empty_dirs(self) -> None:
+        for root, dirs, files in walk(self.media_dir, topdown=False):
+            if root != self.media_dir and not dirs and not files and not self._busy(root):
+                try:
+                    rmdir(root)
+                except OSError:
+                    pass  # Written to since it was listed.
+
+
+@cache
+def get_media_janitor(media_dir: str) -> MediaJanitor:
+    """
+    Returns the janitor of `media_dir`, one per directory per process.
+
+    The quotas can be set with `$MAINIM_MEDIA_MAX_BYTES` and `$MAINIM_MEDIA_MAX_AGE_DAYS`.
+    """
+    return MediaJanitor(
+        media_dir,
+        int(environ.get("MAINIM_MEDIA_MAX_BYTES", DEFAULT_MAX_BYTES)),
+        float(environ.get("MAINIM_MEDIA_MAX_AGE_DAYS", DEFAULT_MAX_AGE_SECONDS / 86400)) * 86400,
+    )
@@ -0,0 +1,20 @@
+"""
+Locations of the on-disk caches shared by the mAInim modules.
+"""
+
+from os import environ, makedirs
+from os.path import expanduser, join
+
+
+def cache_dir(*parts: str) -> str:
+    """
+    Returns (creating it if needed) a directory under the mAInim cache root.
+
+    The root is `$MAINIM_CACHE_DIR`, falling back to `$XDG_CACHE_HOME/mainim` or `~/.cache/mainim`.
+    """
+    root: str = environ.get("MAINIM_CACHE_DIR") or join(
+        environ.get("XDG_CACHE_HOME") or expanduser("~/.cache"), "mainim"
+    )
+    path: str = join(root, *parts)
+    makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,151 @@
+"""
+Render subprocesses that can be limited and reliably stopped.
+
+Every `manim` and `ffmpeg` process is started in a new session, so it leads its
+own process group. Killing the group also kills what the process started
+(ffmpeg for encoding, latex and dvisvgm for Tex), which killing the process
+alone would leave running. A process still running when its caller is cancelled
+(e.g. by a deadline, see `scheduler`) is killed with its group and reaped.
+
+`ProcessLimits` bound CPU time with an rlimit, applied right after the process
+starts (long before manim has imported enough to start any child, which
+inherit it). Memory is policed by resident set size: a watchdog sums the RSS of
+the process and its descendants and kills the group once it exceeds the limit.
+An address-space rlimit is available too, but only on request: it caps
+virtual memory, which thread stacks, BLAS buffers and encoder threads reserve
+far beyond what they use, so it can fail a healthy render at import time.
+"""
+
+from asyncio import Task, create_subprocess_exec, create_task, sleep
+from asyncio.subprocess import PIPE, Process
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from os import killpg, sysconf
+from signal import SIGKILL
+
+from typing import AsyncIterator, Dict, List
+
+# How often the memory watchdog samples the resident memory of a process tree.
+WATCHDOG_INTERVAL_SECONDS: float = 1.0
+
+
+@dataclass
+class ProcessLimits:
+    """
+    Resource limits of a render process and its children; None leaves a limit unset.
+    """
+
+    # Seconds of CPU time, after which the process is killed.
+    cpu_seconds: int | None = None
+    # Bytes of resident memory of the process and its descendants, policed by a watchdog.
+    resident_bytes: int | None = None
+    # Bytes of address space (RLIMIT_AS), beyond which allocations fail; opt-in.
+    address_space_bytes: int | None = None
+
+    def apply(self, pid: int) -> None:
+        """
+        Sets the limits of the running process `pid` (on Linux; elsewhere this does nothing).
+        """
+        import resource
+
+        if not hasattr(resource, "prlimit"):
+            return
+        limits: Dict[int, int | None] = {
+            resource.RLIMIT_CPU: self.cpu_seconds,
+            resource.RLIMIT_AS: self.address_space_bytes,
+        }
+        for limit, value in limits.items():
+            if value is not None:
+                try:
+                    resource.prlimit(pid, limit, (value, value))
+                except (OSError, ValueError) as e:
+                    print(f"Could not limit process {pid}: {e!r}")
+
+
+async def start_process(*args: str, limits: ProcessLimits | None = None) -> Process:
+    """
+    Starts `args` in its own process group with piped output and the given limits.
+    """
+    proc: Process = await create_subprocess_exec(
+        *args, stdout=PIPE, stderr=PIPE, start_new_session=True
+    )
+    if limits is not None:
+        limits.apply(proc.pid)
+    return proc
+
+
+def tree_resident_memory(pid: int) -> int:
+    """
+    Returns the resident memory in bytes of the process and all its descendants (0
+    where /proc is unavailable).
+    """
+    total: int = 0
+    pending: List[int] = [pid]
+    while pending:
+        current: int = pending.pop()
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                total += int(f.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+            with open(f"/proc/{current}/task/{current}/children") as f:
+                pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue  # Exited meanwhile.
+    return total
+
+
+@dataclass
+class Supervision:
+    """
+    A process run by `supervised`, and why it was killed if it broke its limits.
+    """
+
+    proc: Process
+    violation: str | None = None
+
+
+def kill_process_group(proc: Process) -> None:
+    """
+    Kills the process and everything it started.
+    """
+    try:
+        killpg(proc.pid, SIGKILL)  # The process leads its group, whose id is its pid.
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _police_memory(supervision: Supervision, resident_bytes: int) -> None:
+    proc: Process = supervision.proc
+    while proc.returncode is None:
+        used: int = tree_resident_memory(proc.pid)
+        if used > resident_bytes:
+            supervision.violation = (
+                f"MemoryError: the render used {used / 2**20:.0f} MiB of resident memory, "
+                f"over its limit of {resident_bytes / 2**20:.0f} MiB"
+            )
+            print(f"Killing process {proc.pid}: {supervision.violation}")
+            kill_process_group(proc)
+            return
+        await sleep(WATCHDOG_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def supervised(
+    proc: Process, limits: ProcessLimits | None = None
+) -> AsyncIterator[Supervision]:
+    """
+    Polices the resident memory limit of `limits` while the body runs, and kills the
+    process group and reaps the process if the body is cancelled or raises.
+    """
+    supervision: Supervision = Supervision(proc)
+    watchdog: Task | None = None
+    if limits is not None and limits.resident_bytes is not None:
+        watchdog = create_task(_police_memory(supervision, limits.resident_bytes))
+    try:
+        yield supervision
+    except BaseException:
+        kill_process_group(proc)
+        await proc.wait()
+        raise
+    finally:
+        if watchdog is not None:
+            watchdog.cancel()
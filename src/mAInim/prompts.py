@@ -0,0 +1,50 @@
+"""
+The prompt sent to the code generation backends.
+"""
+
+CODE_TOKEN: str = "$CODE"
+
+
+def build_prompt(prompt: str, api_reference: str, manim_version: str = "0.19.0") -> str:
+    """
+    Builds the full code generation prompt for `prompt`, embedding the given Manim API reference.
+    """
+    return f"""
+Your sole purpose is to convert natural language into Manim code.
+You will be given a prompt and you must write valid Manim code to the BEST of your abilities.
+Import ALL the necessary libraries.
+Define ALL constants. Before you write your code, you may think about what to write and redo your code.
+Once you have fininalized your submission, rewrite the code again but add this special marker BEFORE 
+your finalized code: {CODE_TOKEN}
+Ensure all the generated manim code is compatible with manim {manim_version}.
+Ensure EVERY element in the scene is visually distinctive. 
+REMEMBER, YOU MUST OUTPUT CODE WITH ZERO BUGS.
+HERE IS ALL OF THE METHODS OF THE MANIM LIBRARY, MAKE SURE YOU USE THESE METHODS SOLELY: 
+{api_reference}
+Here is the prompt: {prompt}
+"""
+
+
+def build_repair_prompt(
+    snippet: str, error: str, api_reference: str, manim_version: str = "0.19.0"
+) -> str:
+    """
+    Builds the prompt asking the backend to fix `snippet`, the part of a generated
+    scene that failed with `error`.
+    """
+    return f"""
+Your sole purpose is to fix a bug in a snippet of Manim code.
+The snippet below is part of a larger scene that failed with the error shown.
+Rewrite ONLY the snippet so that the error is gone, keeping its behaviour otherwise.
+Do not add imports or code from outside the snippet, and keep the same variable names.
+Once you have finalized your fix, write this special marker: {CODE_TOKEN}
+followed by the corrected snippet in a ```python code block.
+Ensure the code is compatible with manim {manim_version}. Use only these methods:
+{api_reference}
+Here is the error:
+{error}
+Here is the snippet:
+```python
+{snippet}
+```
+"""
@@ -0,0 +1,115 @@
+"""
+A cache of rendered videos keyed on the normalized generated code.
+
+The key is a hash of the transformed module with comments and formatting
+stripped, the scene name, the render quality flags and the manim version, so
+re-rendering a scene that only differs cosmetically returns the earlier video
+without starting manim. Cached videos are evicted by the media directory's
+janitor (see `media_janitor`), which uses the access times recorded here.
+"""
+
+from functools import cache
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from os import makedirs
+from os.path import exists, join
+from threading import Lock
+from time import time
+
+from typing import Dict, Sequence
+
+import ast
+import sqlite3
+
+import libcst as cst
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS renders (
+    key TEXT PRIMARY KEY,
+    video_path TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+"""
+
+
+@cache
+def manim_version() -> str:
+    try:
+        return version("manim")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def normalized_code(code: str | cst.Module) -> str:
+    """
+    Returns a canonical form of the code that ignores comments, whitespace and formatting.
+    """
+    if isinstance(code, cst.Module):
+        code = code.code
+    return ast.dump(ast.parse(code), annotate_fields=False, include_attributes=False)
+
+
+def render_key(code: str | cst.Module, scene_name: str, quality_flags: Sequence[str]) -> str:
+    digest = sha256()
+    for part in (normalized_code(code), scene_name, " ".join(quality_flags), manim_version()):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Maps render keys to the videos manim produced for them under `media_dir`.
+    """
+
+    def __init__(self, media_dir: str) -> None:
+        self.media_dir: str = media_dir
+        self._lock: Lock = Lock()
+        makedirs(media_dir, exist_ok=True)
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            join(media_dir, "render_cache.sqlite3"), check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript(SCHEMA)
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns the cached video for `key`, forgetting entries whose file is gone.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT video_path FROM renders WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if not exists(row[0]):
+                self._connection.execute("DELETE FROM renders WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE renders SET accessed_at = ? WHERE key = ?", (time(), key)
+            )
+            return row[0]
+
+    def put(self, key: str, video_path: str) -> None:
+        now: float = time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO renders VALUES (?, ?, ?, ?)", (key, video_path, now, now)
+            )
+
+    def last_access(self) -> Dict[str, float]:
+        """
+        Maps the cached videos to when they were last stored or served.
+        """
+        with self._lock:
+            return dict(
+                self._connection.execute("SELECT video_path, accessed_at FROM renders").fetchall()
+            )
+
+
+@cache
+def get_render_cache(media_dir: str) -> RenderCache:
+    """
+    Returns the render cache for `media_dir`, one per directory per process.
+    """
+    return RenderCache(media_dir)
@@ -0,0 +1,143 @@
+"""
+Streams the output of a `manim` CLI process instead of buffering it until exit.
+
+Both pipes are read line by line while the render runs. manim's progress bars
+(`Animation 3: Create(Circle):  47%|####7     | 7/15 [...]`, redrawn with
+carriage returns) are parsed into `ProgressEvent`s for a callback, and every
+line is kept in a ring buffer bounded in bytes, so a long or noisy render holds
+only the tail of its log in memory.
+"""
+
+from asyncio import StreamReader, gather
+from collections import deque
+from dataclasses import dataclass
+
+from typing import AsyncIterator, Callable, Deque, List, Tuple
+
+import re
+
+# `Animation 3: Create(Circle):  47%|####7     | 7/15 [00:00<00:00, 64.66it/s]`
+_PROGRESS_PATTERN = re.compile(r"Animation (\d+): (.*?):\s+\d+%\|[^|]*\|\s*(\d+)/(\d+)")
+_LINE_BREAK_PATTERN = re.compile(rb"\r\n|\r|\n")
+
+# Bytes of output kept per pipe, and the most kept of a single line.
+OUTPUT_BUFFER_BYTES: int = 256 * 1024
+MAX_LINE_BYTES: int = 8 * 1024
+
+READ_CHUNK_BYTES: int = 64 * 1024
+
+
+@dataclass
+class ProgressEvent:
+    """
+    The progress of one animation of a scene: `frame` of `total` frames rendered.
+    """
+
+    scene_name: str
+    animation: int
+    description: str
+    frame: int
+    total: int
+
+    @property
+    def done(self) -> bool:
+        return self.frame >= self.total
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+def parse_progress(scene_name: str, line: str) -> ProgressEvent | None:
+    """
+    Parses a manim progress bar line, or returns None if it is not one.
+    """
+    match = _PROGRESS_PATTERN.search(line)
+    if match is None:
+        return None
+    animation, description, frame, total = match.groups()
+    return ProgressEvent(scene_name, int(animation), description, int(frame), int(total))
+
+
+class OutputBuffer:
+    """
+    Keeps the most recent lines of output, dropping the oldest past `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = OUTPUT_BUFFER_BYTES) -> None:
+        self.max_bytes: int = max_bytes
+        self.size: int = 0
+        self.dropped: int = 0
+        self._lines: Deque[str] = deque()
+
+    def append(self, line: str) -> None:
+        if len(line) > MAX_LINE_BYTES:
+            line = line[:MAX_LINE_BYTES] + "..."
+        self._lines.append(line)
+        self.size += len(line) + 1
+        while self.size > self.max_bytes and len(self._lines) > 1:
+            self.size -= len(self._lines.popleft()) + 1
+            self.dropped += 1
+
+    def text(self) -> str:
+        lines: List[str] = list(self._lines)
+        if self.dropped:
+            lines.insert(0, f"[{self.dropped} earlier line(s) dropped]")
+        return "\n".join(lines)
+
+
+async def read_lines(stream: StreamReader) -> AsyncIterator[str]:
+    """
+    Yields the lines of `stream` as they arrive, treating carriage returns (used to
+    redraw progress bars) as line breaks.
+    """
+    pending: bytes = b""
+    while chunk := await stream.read(READ_CHUNK_BYTES):
+        parts: List[bytes] = _LINE_BREAK_PATTERN.split(pending + chunk)
+        pending = parts.pop()
+        if len(pending) > MAX_LINE_BYTES:
+            # A line that never ends must not grow without bound either.
+            parts.append(pending)
+            pending = b""
+        for part in parts:
+            if part:
+                yield part.decode(errors="replace")
+    if pending:
+        yield pending.decode(errors="replace")
+
+
+async def stream_output(
+    stdout: StreamReader,
+    stderr: StreamReader,
+    scene_name: str,
+    on_progress: ProgressCallback | None = None,
+    echo: bool = True,
+) -> Tuple[OutputBuffer, OutputBuffer]:
+    """
+    Reads both pipes of a manim process to their end, reporting progress bar updates
+    to `on_progress` and printing the other lines when `echo` is set.
+
+    Returns the buffered stdout and stderr.
+    """
+    buffers: Tuple[OutputBuffer, OutputBuffer] = (OutputBuffer(), OutputBuffer())
+
+    async def consume(stream: StreamReader, buffer: OutputBuffer, label: str) -> None:
+        last: ProgressEvent | None = None
+        async for line in read_lines(stream):
+            event: ProgressEvent | None = parse_progress(scene_name, line)
+            if event is None:
+                buffer.append(line)
+                if echo:
+                    print(f"{label}: {line}")
+                continue
+            # Bars are redrawn many times per frame; only report actual progress.
+            if event != last and on_progress is not None:
+                on_progress(event)
+            if event.done:
+                buffer.append(line)
+            last = event
+
+    await gather(
+        consume(stdout, buffers[0], "STDOUT"),
+        consume(stderr, buffers[1], "STDERR"),
+    )
+    return buffers
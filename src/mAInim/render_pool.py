@@ -0,0 +1,232 @@
+"""
+A pool of long-lived render worker processes.
+
+Starting the `manim` CLI for every render pays for importing manim, numpy,
+cairo and pango and for parsing the config each time. Each worker here imports
+manim once, then renders jobs by executing the generated module source in a
+fresh namespace and rendering the requested Scene under an isolated
+`tempconfig`. Workers are replaced after a number of jobs or once their
+resident memory has grown past a limit.
+"""
+
+from asyncio import CancelledError, Lock, Queue, to_thread
+from dataclasses import dataclass, field
+from functools import cache
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from os import cpu_count, sysconf
+from time import perf_counter
+
+from typing import Any, Dict, List, Sequence
+
+# Maps manim CLI quality flags to the `quality` config value.
+QUALITY_BY_FLAG: Dict[str, str] = {
+    "-ql": "low_quality",
+    "-qm": "medium_quality",
+    "-qh": "high_quality",
+    "-qp": "production_quality",
+    "-qk": "fourk_quality",
+}
+
+DEFAULT_MAX_JOBS_PER_WORKER: int = 50
+DEFAULT_MAX_RSS_GROWTH: int = 512 * 1024 * 1024
+
+
+def flags_config(flags: Sequence[str]) -> Dict[str, Any]:
+    """
+    Translates the manim CLI render flags (quality, `-s` and `--fps N`) into config values.
+    """
+    config: Dict[str, Any] = {}
+    for index, flag in enumerate(flags):
+        if flag in QUALITY_BY_FLAG:
+            config["quality"] = QUALITY_BY_FLAG[flag]
+        elif flag == "-s":
+            config["save_last_frame"] = True
+        elif flag == "--fps":
+            config["frame_rate"] = float(flags[index + 1])
+    return config
+
+
+@dataclass
+class RenderJob:
+    source: str
+    scene_name: str
+    config: Dict[str, Any] = field(default_factory=dict)
+    filename: str = "generated_code.py"
+
+
+@dataclass
+class RenderResult:
+    scene_name: str
+    video_path: str | None = None
+    error: str | None = None
+    seconds: float = 0.0
+    rss: int = 0
+
+
+def resident_memory() -> int:
+    """
+    Returns this process' resident set size in bytes (0 where /proc is unavailable).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+def render_in_process(job: RenderJob) -> str | None:
+    """
+    Executes the job's source in a clean module namespace and renders its Scene.
+
+    Returns the path of the written movie file, or of the image with `save_last_frame`.
+    """
+    from types import ModuleType
+
+    from manim import tempconfig
+
+    with tempconfig(job.config):
+        # Executed inside `tempconfig`, so that module-level changes such as
+        # `config.background_color = ...` are undone with the job's config.
+        module = ModuleType("generated_code")
+        module.__file__ = job.filename
+        exec(compile(job.source, job.filename, "exec"), module.__dict__)
+
+        scene = module.__dict__[job.scene_name]()
+        scene.render()
+        file_writer = scene.renderer.file_writer
+        if job.config.get("save_last_frame"):
+            return str(file_writer.image_file_path or "") or None
+        return str(file_writer.movie_file_path or "") or None
+
+
+def _worker_main(connection: Connection) -> None:
+    """
+    Worker process entry point: imports manim once, then renders jobs until told to stop.
+    """
+    from traceback import format_exc
+
+    import manim  # noqa: F401 - the expensive import this pool exists to amortize.
+
+    connection.send(resident_memory())
+    while (job := connection.recv()) is not None:
+        start: float = perf_counter()
+        result: RenderResult = RenderResult(job.scene_name)
+        try:
+            result.video_path = render_in_process(job)
+        except BaseException:
+            result.error = format_exc()
+        result.seconds = perf_counter() - start
+        result.rss = resident_memory()
+        connection.send(result)
+
+
+@dataclass
+class _Worker:
+    process: BaseProcess
+    connection: Connection
+    baseline_rss: int
+    jobs: int = 0
+
+
+class RenderPool:
+    """
+    Renders jobs on `size` warm worker processes.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+        max_rss_growth: int = DEFAULT_MAX_RSS_GROWTH,
+    ) -> None:
+        self.size: int = size or max(1, (cpu_count() or 2) // 2)
+        self.max_jobs_per_worker: int = max_jobs_per_worker
+        self.max_rss_growth: int = max_rss_growth
+        self.recycled: int = 0
+        self._context = get_context("spawn")
+        self._idle: Queue = Queue()
+        self._workers: List[_Worker] = []
+        self._start_lock: Lock = Lock()
+
+    def _spawn(self) -> _Worker:
+        parent, child = self._context.Pipe()
+        process: BaseProcess = self._context.Process(
+            target=_worker_main, args=(child,), name="manim-render-worker", daemon=True
+        )
+        process.start()
+        child.close()
+        return _Worker(process, parent, baseline_rss=parent.recv())
+
+    async def start(self) -> None:
+        """
+        Starts the workers (each importing manim) if they are not running yet.
+        """
+        async with self._start_lock:
+            if self._workers:
+                return
+            print(f"Starting {self.size} render worker(s)...")
+            self._workers = [await to_thread(self._spawn) for _ in range(self.size)]
+            for worker in self._workers:
+                self._idle.put_nowait(worker)
+
+    async def _replace(self, worker: _Worker) -> _Worker:
+        await to_thread(self._stop, worker)
+        replacement: _Worker = await to_thread(self._spawn)
+        self._workers[self._workers.index(worker)] = replacement
+        self.recycled += 1
+        return replacement
+
+    def _stop(self, worker: _Worker) -> None:
+        try:
+            worker.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.connection.close()
+
+    async def render(self, job: RenderJob) -> RenderResult:
+        """
+        Renders `job` on the next idle worker.
+        """
+        await self.start()
+        worker: _Worker = await self._idle.get()
+        try:
+            if not worker.process.is_alive():
+                worker = await self._replace(worker)
+            worker.connection.send(job)
+            result: RenderResult = await to_thread(worker.connection.recv)
+        except CancelledError:
+            # The worker is still busy with this job; kill it so it is replaced on next use.
+            worker.process.kill()
+            raise
+        except (EOFError, OSError) as e:
+            result = RenderResult(job.scene_name, error=f"Render worker died: {e!r}")
+            worker = await self._replace(worker)
+        else:
+            worker.jobs += 1
+            if (
+                worker.jobs >= self.max_jobs_per_worker
+                or result.rss - worker.baseline_rss > self.max_rss_growth
+            ):
+                worker = await self._replace(worker)
+        finally:
+            self._idle.put_nowait(worker)
+        return result
+
+    def close(self) -> None:
+        for worker in self._workers:
+            self._stop(worker)
+        self._workers = []
+        self._idle = Queue()
+
+
+@cache
+def get_render_pool() -> RenderPool:
+    """
+    Returns the process-wide render pool.
+    """
+    return RenderPool()
@@ -0,0 +1,228 @@
+"""
+Repairs generated code that failed validation or rendering by re-prompting the backend.
+
+Instead of regenerating the whole scene, the failure is mapped to a line of the
+generated code and only the statements around it are sent back, with the error
+and the catalog entries it mentions. The returned snippet replaces those lines
+and the result goes through validation and rendering again. Every job gets a
+bounded number of attempts and a time and token budget.
+"""
+
+from dataclasses import dataclass
+from textwrap import dedent, indent
+from time import perf_counter
+
+from typing import Awaitable, Callable, List, Tuple
+
+import ast
+import re
+
+from .api_catalog import ApiCatalog
+from .api_retrieval import CHARS_PER_TOKEN, select_api_sections
+from .code_extractor import extract_code
+from .prompts import build_repair_prompt
+
+# `File ".../generated_code.py", line 12, in construct` (plain tracebacks) and
+# `/path/generated_code.py:12 in construct` (manim's rich tracebacks).
+_FRAME_PATTERN = re.compile(r'generated_code\.py"?(?:, line |:)(\d+)')
+_EXCEPTION_PATTERN = re.compile(r"^\s*([A-Za-z_][\w.]*(?:Error|Exception)): (.*)$", re.MULTILINE)
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+
+# Statements on either side of the failing one that are sent along with it.
+CONTEXT_STATEMENTS: int = 2
+
+# Upper bound on the API reference included in a repair prompt.
+REPAIR_API_TOKENS: int = 2000
+
+
+@dataclass
+class RepairBudget:
+    """
+    Limits how much a single job may spend on repairs.
+    """
+
+    max_attempts: int = 2
+    max_seconds: float = 120.0
+    max_tokens: int = 20000
+    attempts: int = 0
+    seconds: float = 0.0
+    tokens: int = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return (
+            self.attempts >= self.max_attempts
+            or self.seconds >= self.max_seconds
+            or self.tokens >= self.max_tokens
+        )
+
+    def spend(self, seconds: float, *texts: str) -> None:
+        self.attempts += 1
+        self.seconds += seconds
+        self.tokens += sum(len(text) for text in texts) // CHARS_PER_TOKEN
+
+
+@dataclass
+class Failure:
+    """
+    Why a version of the code failed: the error and the line of the code it points to.
+    """
+
+    error: str
+    line: int | None = None
+
+
+def parse_traceback(output: str) -> Failure:
+    """
+    Extracts the innermost `generated_code.py` line and the final exception from a traceback.
+    """
+    lines: List[str] = _FRAME_PATTERN.findall(output)
+    exceptions: List[Tuple[str, str]] = _EXCEPTION_PATTERN.findall(output)
+    if exceptions:
+        error: str = ": ".join(exceptions[-1])
+    else:
+        error = "\n".join(output.strip().splitlines()[-5:])
+    return Failure(error, int(lines[-1]) if lines else None)
+
+
+def map_line(line: int, rendered_code: str, code: str) -> int:
+    """
+    Maps a line of the rendered (transformed) code back to the generated code by its content,
+    as the transform passes may add or remove lines.
+    """
+    rendered_lines: List[str] = rendered_code.splitlines()
+    code_lines: List[str] = code.splitlines()
+    if not 1 <= line <= len(rendered_lines):
+        return min(max(line, 1), len(code_lines))
+
+    content: str = rendered_lines[line - 1].strip()
+    candidates: List[int] = [
+        number for number, text in enumerate(code_lines, 1) if text.strip() == content
+    ]
+    if not candidates:
+        return min(line, len(code_lines))
+    return min(candidates, key=lambda number: abs(number - line))
+
+
+def _blocks(statement: ast.stmt) -> List[List[ast.stmt]]:
+    blocks: List[List[ast.stmt]] = [
+        getattr(statement, name)
+        for name in ("body", "orelse", "finalbody")
+        if isinstance(getattr(statement, name, None), list)
+    ]
+    blocks.extend(handler.body for handler in getattr(statement, "handlers", []))
+    blocks.extend(case.body for case in getattr(statement, "cases", []))
+    return [block for block in blocks if block and isinstance(block[0], ast.stmt)]
+
+
+def snippet_range(code: str, line: int | None) -> Tuple[int, int]:
+    """
+    Returns the first and last line of the statements around `line` that make up a
+    self-contained snippet: whole statements from the innermost block containing it.
+
+    The whole code is used when there is no line to go by.
+    """
+    line_count: int = len(code.splitlines())
+    if line is None or line < 1:
+        return 1, line_count
+    try:
+        body: List[ast.stmt] = ast.parse(code).body
+    except SyntaxError:
+        return max(1, line - CONTEXT_STATEMENTS), min(line_count, line + CONTEXT_STATEMENTS)
+
+    while True:
+        index: int | None = next(
+            (
+                index
+                for index, statement in enumerate(body)
+                if _first_line(statement) <= line <= (statement.end_lineno or statement.lineno)
+            ),
+            None,
+        )
+        if index is None:
+            return line, line
+        inner: List[ast.stmt] | None = next(
+            (
+                block
+                for block in _blocks(body[index])
+                if block[0].lineno <= line <= (block[-1].end_lineno or block[-1].lineno)
+            ),
+            None,
+        )
+        if inner is None:
+            break
+        body = inner
+
+    first: ast.stmt = body[max(0, index - CONTEXT_STATEMENTS)]
+    last: ast.stmt = body[min(len(body) - 1, index + CONTEXT_STATEMENTS)]
+    return _first_line(first), last.end_lineno or last.lineno
+
+
+def _first_line(statement: ast.stmt) -> int:
+    decorators: List[ast.expr] = getattr(statement, "decorator_list", [])
+    return min([statement.lineno, *(decorator.lineno for decorator in decorators)])
+
+
+def apply_patch(code: str, start: int, end: int, replacement: str) -> str:
+    """
+    Replaces lines `start`..`end` (inclusive) of `code`, re-indenting the replacement
+    to the indentation of the replaced lines.
+    """
+    lines: List[str] = code.splitlines()
+    original: str = lines[start - 1]
+    prefix: str = original[: len(original) - len(original.lstrip())]
+    patched: str = indent(dedent(replacement).strip("\n"), prefix)
+    return "\n".join([*lines[: start - 1], patched, *lines[end:]]) + "\n"
+
+
+def relevant_api(catalog: ApiCatalog, text: str) -> str:
+    """
+    Returns the catalog sections of the classes named in `text`, topped up with the
+    sections most relevant to it, within `REPAIR_API_TOKENS`.
+    """
+    named: List[str] = [
+        name
+        for name in dict.fromkeys(_IDENTIFIER_PATTERN.findall(text))
+        if catalog.find_class(name) is not None
+    ]
+    return select_api_sections(
+        text, catalog.text, top_k=4, token_budget=REPAIR_API_TOKENS, pinned_titles=named
+    )
+
+
+async def repair_code(
+    code: str,
+    failure: Failure,
+    catalog: ApiCatalog,
+    complete: Callable[[str], Awaitable[str | None]],
+    budget: RepairBudget,
+) -> str | None:
+    """
+    Asks the backend (through `complete`) to fix the failing part of `code` and returns
+    the patched code, or None when the budget is exhausted or no fix was returned.
+
+    `failure.line` must refer to `code` (see `map_line`).
+    """
+    if budget.exhausted:
+        return None
+
+    start, end = snippet_range(code, failure.line)
+    snippet: str = dedent("\n".join(code.splitlines()[start - 1 : end]))
+    prompt: str = build_repair_prompt(
+        snippet,
+        failure.error,
+        relevant_api(catalog, f"{failure.error}\n{snippet}"),
+        catalog.manim_version,
+    )
+
+    print(f"Repairing lines {start}-{end} (attempt {budget.attempts + 1}/{budget.max_attempts})...")
+    started: float = perf_counter()
+    response: str | None = await complete(prompt)
+    budget.spend(perf_counter() - started, prompt, response or "")
+    if not response:
+        return None
+
+    replacement: str = extract_code(response)
+    if not replacement.strip():
+        return None
+    return apply_patch(code, start, end, replacement)
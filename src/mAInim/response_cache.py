@@ -0,0 +1,182 @@
+"""
+A persistent, content-addressed cache of prompt -> generated code.
+
+Entries live in a SQLite database keyed by a hash of the backend, the model,
+the full prompt text and the API catalog version, so a repeated request can
+skip the backend entirely. Only code that rendered is stored, and an entry
+whose code fails to render is deleted, so broken output is never replayed.
+Entries expire after a TTL and the least recently used ones are evicted once
+the stored code exceeds a byte cap.
+"""
+
+from dataclasses import dataclass
+from functools import cache
+from hashlib import sha256
+from os.path import join
+from threading import Lock
+from time import time
+
+from typing import List
+
+import sqlite3
+
+from .paths import cache_dir
+
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS: float = 30 * 24 * 60 * 60
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    code TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def make_key(backend: str, model: str, prompt: str, catalog_version: str) -> str:
+    """
+    Returns the cache key of a request.
+    """
+    digest = sha256()
+    for part in (backend, model, catalog_version, prompt):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    A SQLite-backed LRU cache of generated code with a TTL and a total size cap.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.path: str = path or join(cache_dir(), "responses.sqlite3")
+        self.max_bytes: int = max_bytes
+        self.ttl_seconds: float = ttl_seconds
+        self.stats: CacheStats = CacheStats()
+        self._lock: Lock = Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns the cached code for `key`, or None on a miss or an expired entry.
+        """
+        now: float = time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT code, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.stats.evictions += 1
+                self.stats.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.stats.hits += 1
+            return row[0]
+
+    def put(self, key: str, code: str) -> None:
+        now: float = time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, code, len(code.encode()), now, now),
+            )
+            self._evict(now)
+
+    def delete(self, key: str) -> bool:
+        """
+        Removes the entry for `key`, returning whether there was one.
+        """
+        with self._lock:
+            return (
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount
+                > 0
+            )
+
+    def _evict(self, now: float) -> None:
+        """
+        Drops expired entries, then the least recently used ones until under `max_bytes`.
+        """
+        expired: int = self._connection.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        self.stats.evictions += expired
+
+        total: int = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.stats.evictions += len(victims)
+
+    def codes(self) -> List[str]:
+        """
+        Returns the code of every entry that has not expired.
+        """
+        with self._lock:
+            return [
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT code FROM responses WHERE created_at >= ?",
+                    (time() - self.ttl_seconds,),
+                )
+            ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+@cache
+def get_response_cache() -> ResponseCache:
+    """
+    Returns the process-wide response cache.
+    """
+    return ResponseCache()
@@ -0,0 +1,327 @@
+"""
+Schedules render jobs by priority within the machine's CPU and memory.
+
+A job is one render of generated code (see `mvp.render_code`). Submitted jobs
+wait in a priority queue: `INTERACTIVE` jobs (stills and previews someone is
+waiting for) start before `BATCH` jobs (final renders and batch prompts), and
+jobs of equal priority start in submission order. Every job carries an estimate
+of the cores and memory its render processes use, derived from the quality
+flags and how many scenes and segments run at once. The job at the head of the
+queue starts once it fits beside the running jobs. A job too large to ever fit
+still starts when nothing else is running.
+
+Each job has a wall-clock deadline measured from its start. When it passes, or
+when the job is cancelled, the render is cancelled and its `manim` processes
+are killed with their process groups (see `processes`). CLI processes are
+also limited to the CPU time of the deadline on every estimated core (an
+rlimit), and to a resident memory of their process tree with headroom over the
+memory estimate (policed by a watchdog). An address-space rlimit is only set
+when the scheduler is given one, as it caps reserved rather than used memory.
+Render pool workers are long-lived and are not limited per job; a cancelled
+pool render kills its worker.
+"""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Event, Task, create_task, timeout
+from dataclasses import dataclass, field
+from functools import cache
+from heapq import heappop, heappush
+from itertools import count
+from math import ceil
+from os import cpu_count, environ, getcwd, sysconf
+from time import perf_counter
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Sequence, Tuple
+
+from .processes import ProcessLimits
+
+if TYPE_CHECKING:
+    import libcst as cst
+
+    from .mvp import RenderAttempt
+    from .render_output import ProgressCallback
+
+# Lower values start first.
+INTERACTIVE: int = 0
+BATCH: int = 10
+
+# Wall-clock seconds a render may run, by priority.
+DEADLINE_SECONDS: Dict[int, float] = {INTERACTIVE: 5 * 60, BATCH: 30 * 60}
+
+MIB: int = 1024 * 1024
+
+# Cores and resident memory of one `manim` process by quality flag. The renderer is
+# single-threaded; the ffmpeg encoder it feeds uses more of both as resolution grows.
+PROCESS_ESTIMATES: Dict[str, Tuple[float, int]] = {
+    "-ql": (1.0, 512 * MIB),
+    "-qm": (1.0, 768 * MIB),
+    "-qh": (1.5, 1024 * MIB),
+    "-qp": (2.0, 1536 * MIB),
+    "-qk": (2.0, 3072 * MIB),
+}
+
+# Resident memory a render's process tree may reach, as a multiple of its estimate,
+# before it is killed as a runaway.
+RESIDENT_HEADROOM: int = 4
+
+# Share of the available memory the scheduler hands out to jobs.
+MEMORY_FRACTION: float = 0.8
+
+JOB_STATES: Tuple[str, ...] = ("queued", "running", "done", "failed", "cancelled", "timed out")
+
+
+def available_memory() -> int:
+    """
+    Returns the memory available to new processes in bytes, or the physical memory
+    where /proc/meminfo is unavailable.
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return sysconf("SC_PHYS_PAGES") * sysconf("SC_PAGE_SIZE")
+
+
+@dataclass
+class ResourceEstimate:
+    """
+    The cores and resident memory one render process of a job uses, and how many of
+    its processes run at once.
+    """
+
+    cpus: float
+    memory_bytes: int
+    processes: int = 1
+
+    @property
+    def total_cpus(self) -> float:
+        return self.cpus * self.processes
+
+    @property
+    def total_memory_bytes(self) -> int:
+        return self.memory_bytes * self.processes
+
+
+def estimate_resources(flags: Sequence[str], processes: int = 1) -> ResourceEstimate:
+    """
+    Estimates a job rendering with the manim `flags` in up to `processes` processes at once.
+    """
+    cpus, memory_bytes = PROCESS_ESTIMATES["-ql"]
+    for flag in flags:
+        if flag in PROCESS_ESTIMATES:
+            cpus, memory_bytes = PROCESS_ESTIMATES[flag]
+    return ResourceEstimate(cpus, memory_bytes, max(1, processes))
+
+
+@dataclass
+class Job:
+    id: int
+    code: str
+    priority: int
+    estimate: ResourceEstimate
+    deadline_seconds: float
+    # Keyword arguments of `render_code`.
+    options: Dict[str, Any] = field(default_factory=dict)
+    # The RLIMIT_AS of each render process, if any (see `JobScheduler`).
+    address_space_bytes: int | None = None
+    state: str = "queued"
+    attempt: RenderAttempt | None = None
+    submitted_at: float = field(default_factory=perf_counter)
+    started_at: float | None = None
+    finished_at: float | None = None
+    _task: Task | None = field(default=None, repr=False)
+    _done: Event = field(default_factory=Event, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def limits(self) -> ProcessLimits:
+        """
+        The limits of each of the job's render processes.
+        """
+        return ProcessLimits(
+            cpu_seconds=ceil(self.deadline_seconds * self.estimate.cpus),
+            resident_bytes=self.estimate.memory_bytes * RESIDENT_HEADROOM,
+            address_space_bytes=self.address_space_bytes,
+        )
+
+
+class JobScheduler:
+    """
+    Runs render jobs by priority while their estimates fit in `cpus` cores and
+    `memory_bytes` of memory (see the module docstring).
+
+    With `address_space_bytes`, every CLI render process also gets that RLIMIT_AS.
+    """
+
+    def __init__(
+        self,
+        cpus: float | None = None,
+        memory_bytes: int | None = None,
+        address_space_bytes: int | None = None,
+    ) -> None:
+        self.cpus: float = cpus or float(cpu_count() or 1)
+        self.memory_bytes: int = memory_bytes or int(available_memory() * MEMORY_FRACTION)
+        self.address_space_bytes: int | None = address_space_bytes
+        self.running: Dict[int, Job] = {}
+        self._queue: List[Tuple[int, int, Job]] = []
+        self._ids: Iterator[int] = count()
+
+    @property
+    def queued(self) -> List[Job]:
+        return [job for _, _, job in sorted(self._queue) if job.state == "queued"]
+
+    def _fits(self, estimate: ResourceEstimate) -> bool:
+        cpus: float = sum(job.estimate.total_cpus for job in self.running.values())
+        memory_bytes: int = sum(job.estimate.total_memory_bytes for job in self.running.values())
+        return (
+            cpus + estimate.total_cpus <= self.cpus
+            and memory_bytes + estimate.total_memory_bytes <= self.memory_bytes
+        )
+
+    def submit(
+        self,
+        code: str,
+        path: str = getcwd(),
+        module: cst.Module | None = None,
+        priority: int = INTERACTIVE,
+        deadline_seconds: float | None = None,
+        estimate: ResourceEstimate | None = None,
+        use_render_pool: bool = False,
+        headless: bool = False,
+        validate: bool = True,
+        on_progress: ProgressCallback | None = None,
+        segments: int = 1,
+        flags: Tuple[str, ...] | None = None,
+        niceness: int = 0,
+        smoke_test: bool = True,
+    ) -> Job:
+        """
+        Queues a render of `code` and starts it if it fits; see `mvp.run_manim_code` for
+        the render options. Must be called from a running event loop.
+
+        Without an `estimate`, one is derived from the flags and from the number of
+        scenes (if `module` is given) and segments that render at once.
+        """
+        from .mvp import QUALITY_FLAGS, SCENE_CONCURRENCY
+
+        flags = flags or QUALITY_FLAGS
+        if estimate is None:
+            scenes: int = 1
+            if module is not None:
+                from .cst_parser import find_scene_names
+
+                scenes = len(find_scene_names(module)) or 1
+            estimate = estimate_resources(flags, min(scenes * segments, SCENE_CONCURRENCY))
+
+        job: Job = Job(
+            next(self._ids),
+            code,
+            priority,
+            estimate,
+            deadline_seconds or DEADLINE_SECONDS.get(priority, DEADLINE_SECONDS[BATCH]),
+            {
+                "path": path,
+                "module": module,
+                "use_render_pool": use_render_pool,
+                "headless": headless,
+                "validate": validate,
+                "on_progress": on_progress,
+                "segments": segments,
+                "flags": flags,
+                "niceness": niceness,
+                "smoke_test": smoke_test,
+            },
+            self.address_space_bytes,
+        )
+        heappush(self._queue, (priority, job.id, job))
+        self._dispatch()
+        return job
+
+    def _dispatch(self) -> None:
+        while self._queue:
+            job: Job = self._queue[0][2]
+            if job.state != "queued":
+                heappop(self._queue)  # Cancelled while queued.
+                continue
+            if self.running and not self._fits(job.estimate):
+                break
+            heappop(self._queue)
+            job.state = "running"
+            self.running[job.id] = job
+            job._task = create_task(self._run(job))
+
+    async def _run(self, job: Job) -> None:
+        from .mvp import RenderAttempt, render_code
+
+        job.started_at = perf_counter()
+        try:
+            async with timeout(job.deadline_seconds):
+                job.attempt = await render_code(job.code, **job.options, limits=job.limits)
+            job.state = "done"
+        except TimeoutError:
+            job.state = "timed out"
+            print(f"Render job {job.id} exceeded its {job.deadline_seconds:.0f}s deadline.")
+        except CancelledError:
+            job.state = "cancelled"
+        except Exception as e:
+            job.state = "failed"
+            print(f"Render job {job.id} failed: {e!r}")
+        finally:
+            job.finished_at = perf_counter()
+            job.attempt = job.attempt or RenderAttempt(job.code)
+            del self.running[job.id]
+            job._done.set()
+            self._dispatch()
+
+    def cancel(self, job: Job) -> bool:
+        """
+        Cancels a queued or running job, killing its render processes; returns whether
+        there was anything to cancel.
+        """
+        from .mvp import RenderAttempt
+
+        if job.state == "queued":
+            job.state = "cancelled"
+            job.finished_at = perf_counter()
+            job.attempt = RenderAttempt(job.code)
+            job._done.set()
+            self._dispatch()  # It may have been holding back the jobs behind it.
+            return True
+        if job.state == "running" and job._task is not None:
+            job._task.cancel()
+            return True
+        return False
+
+    async def result(self, job: Job) -> RenderAttempt:
+        """
+        Waits for the job and returns its attempt, cancelling the job if the caller is
+        cancelled.
+
+        A job that was cancelled, timed out or failed returns an attempt without
+        videos or a failure; its `state` says which.
+        """
+        try:
+            await job._done.wait()
+        except CancelledError:
+            self.cancel(job)
+            raise
+        return job.attempt
+
+
+@cache
+def get_scheduler() -> JobScheduler:
+    """
+    Returns the process-wide render job scheduler.
+
+    An address-space limit for render processes can be set with
+    `$MAINIM_RENDER_ADDRESS_SPACE_BYTES`; by default there is none.
+    """
+    address_space: str | None = environ.get("MAINIM_RENDER_ADDRESS_SPACE_BYTES")
+    return JobScheduler(address_space_bytes=int(address_space) if address_space else None)
@@ -0,0 +1,80 @@
+"""
+Segment-parallel rendering of a single scene.
+
+A scene's animations are split into contiguous ranges, each rendered by its
+own process with manim's `--from_animation_number` (`-n START,END`). The
+animations before a segment are replayed with `skip_animations` set, which runs
+the scene's code and finishes each animation without writing any frames, so
+every segment starts from the exact mobject state of the cut. The segment
+movies share their encoding settings and are joined by ffmpeg's concat demuxer
+without re-encoding.
+"""
+
+from os.path import dirname, join
+from shutil import which
+
+from typing import List, Sequence, Tuple
+
+# An inclusive range of animation numbers; None as the end renders to the end of the scene.
+AnimationRange = Tuple[int, int | None]
+
+
+def plan_segments(animations: int, segments: int) -> List[AnimationRange]:
+    """
+    Splits `animations` animations into at most `segments` ranges of similar length.
+
+    The last range is left open so that a segment never misses animations that
+    were not counted.
+    """
+    count: int = max(1, min(segments, animations))
+    bounds: List[int] = [round(index * animations / count) for index in range(count + 1)]
+    return [
+        (bounds[index], bounds[index + 1] - 1 if index < count - 1 else None)
+        for index in range(count)
+    ]
+
+
+def animation_flag(animations: AnimationRange) -> str:
+    """
+    Formats a range as the value of manim's `--from_animation_number`.
+    """
+    start, end = animations
+    return str(start) if end is None else f"{start},{end}"
+
+
+async def concat_videos(video_paths: Sequence[str], output_path: str) -> str | None:
+    """
+    Joins the videos into `output_path` by stream copy, returning an error message on failure.
+    """
+    from .processes import start_process, supervised
+
+    ffmpeg: str | None = which("ffmpeg")
+    if ffmpeg is None:
+        return "ffmpeg executable not found."
+
+    list_path: str = join(dirname(output_path), "segments.txt")
+    with open(list_path, "w") as f:
+        for video_path in video_paths:
+            escaped: str = video_path.replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+    proc = await start_process(
+        ffmpeg,
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        list_path,
+        "-c",
+        "copy",
+        output_path,
+    )
+    async with supervised(proc):
+        _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        return f"ffmpeg concat failed: {stderr.decode().strip()}"
+    return None
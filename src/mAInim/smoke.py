@@ -0,0 +1,108 @@
+"""
+A pre-flight run of a scene that catches errors before any frame is rendered.
+
+The scene runs with manim's `--dry_run`, which writes no files, and with every
+animation skipped (its start is past the last animation): `construct` executes
+in full, mobjects are built, Tex is compiled and every animation is begun and
+finished with its updaters applied, but no frame is drawn or encoded. A scene
+that would crash halfway through a long render fails here in a fraction of the
+render time, and only scenes that pass go on to be rendered.
+"""
+
+from __future__ import annotations
+
+from asyncio import Semaphore
+from dataclasses import dataclass
+from shutil import which
+from time import perf_counter
+
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from .processes import ProcessLimits
+
+# An animation number no scene reaches, so that all of them are skipped.
+SKIP_ALL_ANIMATIONS: int = 10**9
+
+SMOKE_FLAGS: Tuple[str, ...] = (
+    "-ql",
+    "--dry_run",
+    "--from_animation_number",
+    str(SKIP_ALL_ANIMATIONS),
+)
+
+
+@dataclass
+class SmokeResult:
+    scene_name: str
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def smoke_test_with_cli(
+    code_file: str,
+    scene_name: str,
+    media_dir: str,
+    slots: Semaphore | None = None,
+    config_file: str | None = None,
+    limits: ProcessLimits | None = None,
+) -> SmokeResult:
+    """
+    Runs the scene's dry run with a fresh `manim` CLI process, within one of `slots`,
+    with the manim config file `config_file` and under `limits`, if given.
+    """
+    from .processes import start_process, supervised
+    from .render_output import stream_output
+
+    manim_path: str | None = which("manim")
+    if manim_path is None:
+        return SmokeResult(scene_name, error="Manim executable not found.")
+
+    async with slots or Semaphore():
+        start: float = perf_counter()
+        proc = await start_process(
+            manim_path,
+            *SMOKE_FLAGS,
+            code_file,
+            "--media_dir",
+            media_dir,
+            *(("--config_file", config_file) if config_file else ()),
+            scene_name,
+            limits=limits,
+        )
+        async with supervised(proc, limits) as supervision:
+            stdout, stderr = await stream_output(proc.stdout, proc.stderr, scene_name, echo=False)
+            failed: bool = await proc.wait() != 0
+        seconds: float = perf_counter() - start
+    if not failed:
+        return SmokeResult(scene_name, seconds)
+    return SmokeResult(
+        scene_name, seconds, f"{stdout.text()}\n{stderr.text()}\n{supervision.violation or ''}"
+    )
+
+
+async def smoke_test_with_pool(
+    code: str, code_file: str, scene_name: str, media_dir: str, tex_dir: str | None = None
+) -> SmokeResult:
+    """
+    Runs the scene's dry run on a warm worker of the shared render pool, compiling
+    LaTeX into `tex_dir` if given.
+    """
+    from .render_pool import RenderJob, RenderResult, get_render_pool
+
+    config: Dict[str, Any] = {
+        "quality": "low_quality",
+        "media_dir": media_dir,
+        "dry_run": True,
+        "from_animation_number": SKIP_ALL_ANIMATIONS,
+    }
+    if tex_dir is not None:
+        config["tex_dir"] = tex_dir
+    result: RenderResult = await get_render_pool().render(
+        RenderJob(code, scene_name, config, code_file)
+    )
+    return SmokeResult(scene_name, result.seconds, result.error)
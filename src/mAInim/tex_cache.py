@@ -0,0 +1,236 @@
+"""
+A LaTeX cache shared by every render job, and a command to pre-warm it.
+
+manim compiles each `Tex`/`MathTex` expression to an SVG named by a hash of
+the expression and its template, so a directory of those SVGs is a
+content-addressed cache. Jobs do not share one `tex_dir` directly, as two jobs
+compiling the same expression at once would write the same files and one could
+read the other's half-written SVG. Instead each job gets a private directory
+that links to every SVG of the shared store (`checkout`), and once the job is
+done the SVGs it compiled are copied into the store under a temporary name and
+atomically renamed into place (`publish`), so the store only ever holds
+complete files, and the job's directory is removed (`release`). The store keeps
+at most `max_files` SVGs, evicting the least recently used, which also bounds
+the cost of a checkout.
+
+The warm-up command compiles the expressions used most often in past generated
+code (from the response cache) into the store:
+
+    python -m mAInim.tex_cache [--top N]
+"""
+
+from argparse import ArgumentParser
+from collections import Counter
+from functools import cache
+from os import (
+    environ,
+    getpid,
+    link,
+    listdir,
+    makedirs,
+    remove,
+    replace,
+    stat,
+    stat_result,
+    symlink,
+)
+from os.path import exists, join
+from shutil import copyfile, rmtree
+from tempfile import TemporaryDirectory
+from threading import get_ident
+
+from typing import List, Set, Tuple
+
+import ast
+
+from .paths import cache_dir
+
+# Constructors whose string arguments manim compiles with LaTeX.
+TEX_CLASSES: Tuple[str, ...] = ("MathTex", "Tex", "SingleStringMathTex")
+
+# Only the compiled SVGs are reused by manim; the .tex and .dvi files are intermediate.
+CACHED_SUFFIX: str = ".svg"
+
+DEFAULT_WARM_UP_COUNT: int = 200
+
+DEFAULT_MAX_FILES: int = 5000
+
+
+class TexCache:
+    """
+    A content-addressed store of compiled LaTeX shared through per-job directories.
+    """
+
+    def __init__(self, directory: str, max_files: int = DEFAULT_MAX_FILES) -> None:
+        self.directory: str = directory
+        self.max_files: int = max_files
+        makedirs(directory, exist_ok=True)
+
+    def _entries(self) -> List[str]:
+        return [name for name in listdir(self.directory) if name.endswith(CACHED_SUFFIX)]
+
+    def checkout(self, tex_dir: str) -> int:
+        """
+        Links every cached SVG into the job's `tex_dir`, returning how many were added.
+        """
+        makedirs(tex_dir, exist_ok=True)
+        added: int = 0
+        for name in self._entries():
+            target: str = join(tex_dir, name)
+            if exists(target):
+                continue
+            try:
+                link(join(self.directory, name), target)
+            except OSError:
+                try:
+                    symlink(join(self.directory, name), target)  # Across file systems.
+                except OSError:
+                    continue
+            added += 1
+        return added
+
+    def publish(self, tex_dir: str) -> int:
+        """
+        Adds the SVGs the job compiled into `tex_dir` to the store, returning how many.
+        """
+        if not exists(tex_dir):
+            return 0
+        known: Set[str] = set(self._entries())
+        published: int = 0
+        for name in listdir(tex_dir):
+            if not name.endswith(CACHED_SUFFIX) or name in known:
+                continue
+            temporary: str = join(self.directory, f".{name}.{getpid()}.{get_ident()}.tmp")
+            try:
+                copyfile(join(tex_dir, name), temporary)
+                # Atomic: readers see the whole file or none. Concurrent publishers of the
+                # same expression write identical content, so either one may win.
+                replace(temporary, join(self.directory, name))
+            except OSError:
+                if exists(temporary):
+                    remove(temporary)
+                continue
+            published += 1
+        if published:
+            self.trim()
+        return published
+
+    def release(self, tex_dir: str) -> int:
+        """
+        Publishes the job's SVGs and removes its `tex_dir`, whose files are then all in
+        the store; returns how many were published.
+
+        `tex_dir` must belong to this job alone, as it is removed even if another
+        render is using it; render jobs keep theirs in a working directory of their
+        own (see `mvp.make_work_dir`).
+        """
+        published: int = self.publish(tex_dir)
+        rmtree(tex_dir, ignore_errors=True)
+        return published
+
+    def trim(self) -> int:
+        """
+        Evicts the least recently used SVGs beyond `max_files`, returning how many.
+
+        Reading an SVG through a job's hard link updates its access time too (at most
+        daily with `relatime`), so a checkout alone does not count as a use. Jobs
+        holding a hard link to an evicted SVG keep their copy.
+        """
+        last_used: List[Tuple[float, str]] = []
+        for name in self._entries():
+            try:
+                info: stat_result = stat(join(self.directory, name))
+            except OSError:
+                continue
+            last_used.append((max(info.st_atime, info.st_mtime), name))
+        evicted: int = 0
+        for _, name in sorted(last_used)[: max(0, len(last_used) - self.max_files)]:
+            try:
+                remove(join(self.directory, name))
+            except OSError:
+                continue
+            evicted += 1
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+
+@cache
+def get_tex_cache() -> TexCache:
+    """
+    Returns the shared Tex cache under the mAInim cache root.
+
+    Its size can be set with `$MAINIM_TEX_CACHE_MAX_FILES`.
+    """
+    return TexCache(
+        cache_dir("tex"), int(environ.get("MAINIM_TEX_CACHE_MAX_FILES", DEFAULT_MAX_FILES))
+    )
+
+
+def mine_expressions(codes: List[str]) -> Counter:
+    """
+    Counts the LaTeX expressions passed as string literals to `TEX_CLASSES` in the code.
+
+    Each expression is the tuple of a call's positional arguments, which manim compiles
+    together.
+    """
+    expressions: Counter = Counter()
+    for code in codes:
+        try:
+            tree: ast.Module = ast.parse(code)
+        except SyntaxError:
+            continue
+        for node in ast.walk(tree):
+            if not (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id in TEX_CLASSES
+                and node.args
+            ):
+                continue
+            strings: List[str] = [
+                arg.value
+                for arg in node.args
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+            ]
+            if len(strings) == len(node.args):
+                expressions[(node.func.id, *strings)] += 1
+    return expressions
+
+
+def warm_up(top: int = DEFAULT_WARM_UP_COUNT) -> int:
+    """
+    Compiles the `top` most frequent expressions of past generated code into the store.
+
+    Returns the number of SVGs added to it.
+    """
+    import manim
+    from manim import tempconfig
+
+    from .response_cache import get_response_cache
+
+    expressions: Counter = mine_expressions(get_response_cache().codes())
+    tex_cache: TexCache = get_tex_cache()
+    print(f"Found {len(expressions)} distinct expression(s), compiling the {top} most frequent...")
+    with TemporaryDirectory() as tex_dir:
+        tex_cache.checkout(tex_dir)
+        with tempconfig({"tex_dir": tex_dir}):
+            for (class_name, *strings), count in expressions.most_common(top):
+                try:
+                    getattr(manim, class_name)(*strings)
+                except Exception as e:
+                    print(f"Skipping {class_name}{tuple(strings)} (used {count}x): {e}")
+        return tex_cache.publish(tex_dir)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Pre-compiles frequent LaTeX expressions.")
+    parser.add_argument("--top", type=int, default=DEFAULT_WARM_UP_COUNT)
+    args = parser.parse_args()
+    added: int = warm_up(args.top)
+    print(f"Added {added} SVG(s); the Tex cache holds {len(get_tex_cache())}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Renders generated code in tiers, from the quickest feedback to the final video.
+
+1. `still`: the last frame of every scene as a PNG (`-s`), which skips all
+   animations and encodes nothing;
+2. `preview`: a low-resolution, low frame rate video;
+3. `final`: the high-quality video (`-qh`, or e.g. `-qk`), started alongside the
+   preview in the background at a lower CPU priority.
+
+The still and the preview are `INTERACTIVE` jobs of the render scheduler and
+the final render a `BATCH` one, so finals queue behind the previews of other
+renders rather than delaying them (see `scheduler`).
+
+The code is validated once, for the still, which also serves as its smoke test
+(see `smoke`); the later tiers render the validated code as is. The LaTeX the
+still compiled is published to the shared Tex cache (see `tex_cache`), so the
+later tiers do not compile it again. Subscribers are called as each tier is ready.
+
+`mvp.render_tiers` renders generated code this way; it is used by
+`generate_video(tiered=True)` and `python -m mAInim --tiered`.
+"""
+
+from __future__ import annotations
+
+from asyncio import Event, Task, create_task
+from dataclasses import dataclass
+from os import getcwd
+from time import perf_counter
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+from .mvp import RenderAttempt
+from .scheduler import BATCH, INTERACTIVE, JobScheduler, get_scheduler
+
+if TYPE_CHECKING:
+    import libcst as cst
+
+STILL_FLAGS: Tuple[str, ...] = ("-ql", "-s")
+PREVIEW_FLAGS: Tuple[str, ...] = ("-ql", "--fps", "10")
+FINAL_FLAGS: Tuple[str, ...] = ("-qh",)
+
+TIERS: Tuple[str, ...] = ("still", "preview", "final")
+
+# `nice` increment of the final render, so it does not slow the preview down.
+FINAL_NICENESS: int = 10
+
+
+@dataclass
+class TierResult:
+    tier: str
+    attempt: RenderAttempt
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.attempt.video_path is not None
+
+
+TierCallback = Callable[[TierResult], None]
+
+
+class TieredRender:
+    """
+    Renders `code` in tiers (see the module docstring), notifying subscribers as each
+    tier is ready.
+    """
+
+    def __init__(
+        self,
+        code: str,
+        path: str = getcwd(),
+        module: cst.Module | None = None,
+        use_render_pool: bool = False,
+        final_flags: Tuple[str, ...] = FINAL_FLAGS,
+    ) -> None:
+        self.code: str = code
+        self.path: str = path
+        self.module: cst.Module | None = module
+        self.use_render_pool: bool = use_render_pool
+        self.flags: Dict[str, Tuple[str, ...]] = {
+            "still": STILL_FLAGS,
+            "preview": PREVIEW_FLAGS,
+            "final": final_flags,
+        }
+        self.results: Dict[str, TierResult] = {}
+        self.final_task: Task | None = None
+        self._subscribers: List[TierCallback] = []
+        self._ready: Dict[str, Event] = {tier: Event() for tier in TIERS}
+
+    def subscribe(self, callback: TierCallback) -> None:
+        """
+        Calls `callback` with every tier's result as it is ready, starting with those
+        that already are.
+        """
+        for tier in TIERS:
+            if tier in self.results:
+                callback(self.results[tier])
+        self._subscribers.append(callback)
+
+    async def wait(self, tier: str) -> TierResult | None:
+        """
+        Waits for `tier`, returning None if it was not rendered because an earlier tier failed.
+        """
+        await self._ready[tier].wait()
+        return self.results.get(tier)
+
+    def _publish(self, result: TierResult) -> None:
+        self.results[result.tier] = result
+        for callback in self._subscribers:
+            try:
+                callback(result)
+            except Exception as e:
+                print(f"Tier subscriber error: {e!r}")
+
+    def _skip(self, *tiers: str) -> None:
+        for tier in tiers:
+            self._ready[tier].set()
+
+    async def _render(self, tier: str, code: str, validate: bool) -> TierResult:
+        start: float = perf_counter()
+        scheduler: JobScheduler = get_scheduler()
+        try:
+            attempt: RenderAttempt = await scheduler.result(
+                scheduler.submit(
+                    code,
+                    self.path,
+                    self.module if validate else None,
+                    BATCH if tier == "final" else INTERACTIVE,
+                    use_render_pool=self.use_render_pool,
+                    headless=True,
+                    validate=validate,
+                    flags=self.flags[tier],
+                    niceness=FINAL_NICENESS if tier == "final" else 0,
+                    smoke_test=validate,
+                )
+            )
+        finally:
+            self._ready[tier].set()  # Waiters see no result if the render raised.
+        result: TierResult = TierResult(tier, attempt, perf_counter() - start)
+        print(f"The {tier} tier {'is ready' if result.ok else 'failed'} after {result.seconds:.1f}s.")
+        self._publish(result)
+        return result
+
+    async def run(self) -> TierResult:
+        """
+        Renders the still, then the preview while the final render runs in the
+        background (in `final_task`).
+
+        Returns the preview, or the still if it failed.
+        """
+        still: TierResult = await self._render("still", self.code, validate=True)
+        if not still.ok:
+            self._skip("preview", "final")
+            return still
+
+        # The later tiers render the validated (possibly auto-fixed) code.
+        code: str = still.attempt.code
+        preview: Task = create_task(self._render("preview", code, validate=False))
+        self.final_task = create_task(self._render("final", code, validate=False))
+        return await preview
@@ -0,0 +1,227 @@
+"""
+A registry of composable CST transform passes applied to generated code.
+
+Every pass is a `libcst` transformer registered under a name, with the names of
+the passes it must run after. The pipeline orders the enabled passes by their
+dependencies and fuses consecutive fusable passes into a single tree walk that
+dispatches every node to each pass in turn, so adding a pass does not add a
+walk. Each pass reports the time it spent and the nodes it handled and changed.
+
+The enabled passes can be changed per deployment with `$MAINIM_TRANSFORM_PASSES`:
+a comma-separated list of pass names replaces the defaults, while `+name` and
+`-name` entries enable or disable single passes relative to them.
+"""
+
+from dataclasses import dataclass
+from os import environ
+from time import perf_counter
+
+from typing import Callable, ClassVar, Dict, Iterable, List, Tuple, Type, TypeVar
+
+import libcst as cst
+
+PASSES_ENV: str = "MAINIM_TRANSFORM_PASSES"
+
+
+class TransformPass(cst.CSTTransformer):
+    """
+    A named transform over the generated module.
+
+    Fusable passes may only define `visit_<Node>` and `leave_<Node>` methods and
+    must only depend on the earlier passes' output through the `updated_node`
+    they are given, which lets them share a walk with those passes. Others set
+    `fusable = False` and get a walk of their own.
+    """
+
+    name: ClassVar[str]
+    requires: ClassVar[Tuple[str, ...]] = ()
+    fusable: ClassVar[bool] = True
+    enabled_by_default: ClassVar[bool] = True
+
+
+PassT = TypeVar("PassT", bound=Type[TransformPass])
+
+PASSES: Dict[str, Type[TransformPass]] = {}
+
+
+def register_pass(transform_pass: PassT) -> PassT:
+    """
+    Class decorator adding a pass to the registry under its `name`.
+    """
+    if transform_pass.name in PASSES:
+        raise ValueError(f"A transform pass named {transform_pass.name!r} is already registered.")
+    PASSES[transform_pass.name] = transform_pass
+    return transform_pass
+
+
+def enabled_passes(spec: str | None = None) -> List[str]:
+    """
+    Returns the names of the passes enabled by `spec`, by default `$MAINIM_TRANSFORM_PASSES`.
+    """
+    if spec is None:
+        spec = environ.get(PASSES_ENV, "")
+    entries: List[str] = [entry.strip() for entry in spec.split(",") if entry.strip()]
+
+    if any(entry[0] not in "+-" for entry in entries):
+        names: List[str] = [entry.lstrip("+") for entry in entries if entry[0] != "-"]
+    else:
+        names = [name for name, transform_pass in PASSES.items() if transform_pass.enabled_by_default]
+        for entry in entries:
+            name: str = entry[1:]
+            if entry[0] == "+" and name not in names:
+                names.append(name)
+            elif entry[0] == "-" and name in names:
+                names.remove(name)
+
+    unknown: List[str] = [name for name in names if name not in PASSES]
+    if unknown:
+        raise ValueError(f"Unknown transform pass(es): {', '.join(unknown)}")
+    return names
+
+
+def order_passes(names: Iterable[str]) -> List[str]:
+    """
+    Orders the passes so that every pass comes after the passes it requires,
+    otherwise keeping their registration order.
+    """
+    selected: List[str] = [name for name in PASSES if name in set(names)]
+    ordered: List[str] = []
+    visiting: List[str] = []
+
+    def place(name: str) -> None:
+        if name in ordered:
+            return
+        if name in visiting:
+            raise ValueError(f"Transform passes have a dependency cycle: {' -> '.join(visiting)}")
+        visiting.append(name)
+        for requirement in PASSES[name].requires:
+            if requirement not in selected:
+                raise ValueError(
+                    f"Transform pass {name!r} requires {requirement!r}, which is not enabled."
+                )
+            place(requirement)
+        visiting.pop()
+        ordered.append(name)
+
+    for name in selected:
+        place(name)
+    return ordered
+
+
+@dataclass
+class PassStats:
+    name: str
+    walk: int
+    seconds: float = 0.0
+    nodes: int = 0
+    changed: int = 0
+
+
+class FusedTransformer(cst.CSTTransformer):
+    """
+    Runs several passes in a single walk, calling each pass' visitor for a node in order.
+
+    A pass whose `visit_<Node>` returns False does not see that node's children,
+    while the other passes still do.
+    """
+
+    def __init__(self, passes: List[TransformPass], stats: List[PassStats]) -> None:
+        super().__init__()
+        self.passes: List[TransformPass] = passes
+        self.stats: List[PassStats] = stats
+        # Index of a pass -> the node whose children it asked to skip.
+        self._suspended: Dict[int, cst.CSTNode] = {}
+        self._visitors: Dict[str, List[Tuple[int, Callable]]] = {}
+        self._leavers: Dict[str, List[Tuple[int, Callable]]] = {}
+
+    def _methods(
+        self, cache: Dict[str, List[Tuple[int, Callable]]], prefix: str, node_type: str
+    ) -> List[Tuple[int, Callable]]:
+        methods: List[Tuple[int, Callable]] | None = cache.get(node_type)
+        if methods is None:
+            name: str = f"{prefix}_{node_type}"
+            # `CSTTransformer` defines a no-op for every node type; only overrides count.
+            default: Callable | None = getattr(cst.CSTTransformer, name, None)
+            methods = cache[node_type] = [
+                (index, getattr(transform_pass, name))
+                for index, transform_pass in enumerate(self.passes)
+                if getattr(type(transform_pass), name, None) not in (None, default)
+            ]
+        return methods
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        for index, visit in self._methods(self._visitors, "visit", type(node).__name__):
+            if index in self._suspended:
+                continue
+            stats: PassStats = self.stats[index]
+            start: float = perf_counter()
+            visit_children = visit(node)
+            stats.seconds += perf_counter() - start
+            stats.nodes += 1
+            if visit_children is False:
+                self._suspended[index] = node
+        return len(self._suspended) < len(self.passes)
+
+    def on_leave(self, original_node: cst.CSTNode, updated_node: cst.CSTNode):
+        result = updated_node
+        for index, leave in self._methods(self._leavers, "leave", type(original_node).__name__):
+            suspended_at: cst.CSTNode | None = self._suspended.get(index)
+            if suspended_at is not None and suspended_at is not original_node:
+                continue
+            stats: PassStats = self.stats[index]
+            start: float = perf_counter()
+            returned = leave(original_node, result)
+            stats.seconds += perf_counter() - start
+            stats.nodes += 1
+            if returned is not result:
+                stats.changed += 1
+            result = returned
+            if not isinstance(result, cst.CSTNode):
+                break  # Removed or flattened: there is no single node left for later passes.
+
+        for index, suspended_at in list(self._suspended.items()):
+            if suspended_at is original_node:
+                del self._suspended[index]
+        return result
+
+
+class TransformPipeline:
+    """
+    Applies the named passes (by default the enabled ones) to a module.
+    """
+
+    def __init__(self, names: Iterable[str] | None = None) -> None:
+        self.names: List[str] = order_passes(enabled_passes() if names is None else names)
+        self.stats: List[PassStats] = []
+
+    def walks(self) -> List[List[str]]:
+        """
+        Groups the ordered passes into tree walks, fusing consecutive fusable passes.
+        """
+        walks: List[List[str]] = []
+        for name in self.names:
+            if walks and PASSES[name].fusable and all(PASSES[n].fusable for n in walks[-1]):
+                walks[-1].append(name)
+            else:
+                walks.append([name])
+        return walks
+
+    def run(self, module: cst.Module) -> cst.Module:
+        """
+        Transforms `module` with fresh instances of the passes.
+
+        The per-pass statistics of the run are left in `self.stats`.
+        """
+        self.stats = []
+        for walk, names in enumerate(self.walks()):
+            passes: List[TransformPass] = [PASSES[name]() for name in names]
+            stats: List[PassStats] = [PassStats(name, walk) for name in names]
+            module = module.visit(FusedTransformer(passes, stats))
+            self.stats.extend(stats)
+        return module
+
+    def report(self) -> str:
+        return ", ".join(
+            f"{stats.name} {stats.seconds * 1000:.1f}ms ({stats.nodes} nodes, {stats.changed} changed)"
+            for stats in self.stats
+        )
@@ -0,0 +1,406 @@
+"""
+Static validation of generated code before it is rendered.
+
+Rendering broken code costs a manim start-up before the error surfaces. The
+checks here take milliseconds: the code must compile, define at least one Scene
+subclass with a `construct` method, and only call classes, functions and
+methods (with keyword arguments) that exist in the API catalog. Names are
+resolved with libcst's scope analysis, so locally defined or imported names
+are never mistaken for hallucinated ones.
+
+Misspelled names with a single close match in the catalog and unknown keyword
+arguments are fixed automatically; anything else rejects the code. Names that
+the installed manim exports but the catalog lacks are only warned about, and
+never renamed to a catalog name.
+"""
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher, get_close_matches
+from functools import lru_cache
+from time import perf_counter
+
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+
+import ast
+import builtins
+
+import libcst as cst
+from libcst.metadata import MetadataWrapper, PositionProvider, ScopeProvider
+
+from .api_catalog import ApiCatalog, ApiClass, ApiFunction, get_catalog
+from .cst_parser import find_scene_names
+
+# Bases that end a class hierarchy without hiding any methods.
+ROOT_BASES: FrozenSet[str] = frozenset(("object", "ABC", "Generic", "Protocol"))
+
+# `Mobject.__getattr__` provides `get_<attribute>` and `set_<attribute>` for any attribute.
+DYNAMIC_METHOD_PREFIXES: Tuple[str, ...] = ("get_", "set_")
+
+BUILTIN_NAMES: FrozenSet[str] = frozenset(dir(builtins))
+
+# How similar a name must be to a catalog name to be replaced by it.
+FIX_CUTOFF: float = 0.8
+
+
+@dataclass
+class ValidationIssue:
+    line: int
+    message: str
+    fixed: bool = False
+    # Reported without rejecting the code.
+    warning: bool = False
+
+    @property
+    def blocking(self) -> bool:
+        return not self.fixed and not self.warning
+
+    def __str__(self) -> str:
+        suffix: str = " (fixed)" if self.fixed else " (warning)" if self.warning else ""
+        return f"line {self.line}: {self.message}{suffix}"
+
+
+@dataclass
+class ValidationResult:
+    code: str
+    module: cst.Module | None
+    issues: List[ValidationIssue] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.module is not None and not any(issue.blocking for issue in self.issues)
+
+    @property
+    def fixed(self) -> bool:
+        return any(issue.fixed for issue in self.issues)
+
+
+@lru_cache(maxsize=4096)
+def signature_parameters(signature: str) -> Tuple[FrozenSet[str], bool] | None:
+    """
+    Returns the keyword-capable parameter names of a catalog signature and whether
+    it takes `**kwargs`, or None if the signature cannot be parsed.
+    """
+    try:
+        function = ast.parse(f"{signature}\n    ...").body[0]
+    except SyntaxError:
+        return None
+    if not isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return None
+    arguments: ast.arguments = function.args
+    names: FrozenSet[str] = frozenset(
+        argument.arg for argument in (*arguments.args, *arguments.kwonlyargs)
+    )
+    return names, arguments.kwarg is not None
+
+
+def _base_name(expression: cst.BaseExpression) -> str | None:
+    if isinstance(expression, cst.Name):
+        return expression.value
+    if isinstance(expression, cst.Attribute):
+        return expression.attr.value
+    if isinstance(expression, cst.Subscript):
+        return _base_name(expression.value)
+    return None
+
+
+class _Checker(cst.CSTVisitor):
+    """
+    Collects the issues of a module, and the replacements that fix the fixable ones.
+    """
+
+    METADATA_DEPENDENCIES = (ScopeProvider, PositionProvider)
+
+    def __init__(self, catalog: ApiCatalog) -> None:
+        super().__init__()
+        self.catalog: ApiCatalog = catalog
+        self.issues: List[ValidationIssue] = []
+        self.local_classes: Dict[str, cst.ClassDef] = {}
+        # Target name node of `x = Class(...)` -> Class.
+        self.instance_assignments: Dict[cst.Name, str] = {}
+        # Every call, with the local class whose body it is in.
+        self.calls: List[Tuple[cst.Call, str | None]] = []
+        self.renames: Dict[cst.Name, str] = {}
+        self.removed_args: Set[cst.Arg] = set()
+        self._class_stack: List[str] = []
+
+    def _line(self, node: cst.CSTNode) -> int:
+        return self.get_metadata(PositionProvider, node).start.line
+
+    def _report(
+        self, node: cst.CSTNode, message: str, fixed: bool = False, warning: bool = False
+    ) -> None:
+        self.issues.append(ValidationIssue(self._line(node), message, fixed, warning))
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:
+        self.local_classes.setdefault(node.name.value, node)
+        self._class_stack.append(node.name.value)
+
+    def leave_ClassDef(self, original_node: cst.ClassDef) -> None:
+        self._class_stack.pop()
+
+    def visit_Assign(self, node: cst.Assign) -> None:
+        if (
+            len(node.targets) == 1
+            and isinstance(node.targets[0].target, cst.Name)
+            and isinstance(node.value, cst.Call)
+            and isinstance(node.value.func, cst.Name)
+        ):
+            self.instance_assignments[node.targets[0].target] = node.value.func.value
+
+    def visit_Call(self, node: cst.Call) -> None:
+        self.calls.append((node, self._class_stack[-1] if self._class_stack else None))
+
+    def leave_Module(self, original_node: cst.Module) -> None:
+        # Calls are checked once every assignment and class of the module is known.
+        for call, enclosing_class in self.calls:
+            self._check_call(call, enclosing_class)
+
+    # Name resolution.
+
+    def _is_defined(self, name: cst.Name) -> bool:
+        scope = self.get_metadata(ScopeProvider, name, None)
+        return name.value in BUILTIN_NAMES or scope is None or name.value in scope
+
+    def _catalog_bases(self, name: str, seen: Set[str] | None = None) -> List[str]:
+        """
+        Returns the non-local classes a class derives from, through local classes.
+        """
+        seen = seen or set()
+        if name in seen or name not in self.local_classes:
+            return [name]
+        seen.add(name)
+        bases: List[str] = []
+        for base in self.local_classes[name].bases:
+            base_name: str | None = _base_name(base.value)
+            if base_name is not None:
+                bases.extend(self._catalog_bases(base_name, seen))
+        return bases
+
+    def _local_methods(self, name: str) -> Set[str]:
+        """
+        Returns the methods defined by a local class and its local base classes.
+        """
+        methods: Set[str] = set()
+        pending: List[str] = [name]
+        seen: Set[str] = set()
+        while pending:
+            class_name: str = pending.pop()
+            node: cst.ClassDef | None = self.local_classes.get(class_name)
+            if node is None or class_name in seen:
+                continue
+            seen.add(class_name)
+            methods |= {
+                statement.name.value
+                for statement in node.body.body
+                if isinstance(statement, cst.FunctionDef)
+            }
+            pending.extend(filter(None, (_base_name(base.value) for base in node.bases)))
+        return methods
+
+    def _instance_class(
+        self, expression: cst.BaseExpression, enclosing_class: str | None
+    ) -> str | None:
+        """
+        Returns the class an expression is an instance of (or the catalog class it
+        names), when it is statically known.
+        """
+        if isinstance(expression, cst.Call) and isinstance(expression.func, cst.Name):
+            return expression.func.value
+        if not isinstance(expression, cst.Name):
+            return None
+        if expression.value == "self":
+            return enclosing_class
+
+        scope = self.get_metadata(ScopeProvider, expression, None)
+        if scope is None:
+            return None
+        assignments = list(scope[expression.value])
+        if not assignments:
+            return expression.value if self.catalog.find_class(expression.value) else None
+        if len(assignments) == 1 and assignments[0].node in self.instance_assignments:
+            return self.instance_assignments[assignments[0].node]
+        return None
+
+    def _complete_mro(self, class_name: str) -> List[ApiClass] | None:
+        """
+        Returns the catalog classes `class_name` derives from, or None when part of
+        its hierarchy is unknown (so a missing method may exist after all).
+        """
+        classes: List[ApiClass] = list(self.catalog.mro(class_name))
+        known: Set[str] = {api_class.name for api_class in classes}
+        for api_class in classes:
+            for base in api_class.bases:
+                base_name: str = base.split("[", 1)[0].split(".")[-1]
+                if base_name not in known and base_name not in ROOT_BASES:
+                    return None
+        return classes or None
+
+    def _accepted_keywords(self, class_name: str) -> FrozenSet[str] | None:
+        """
+        Returns the keyword arguments the class' constructor chain accepts, or None if unknown.
+        """
+        accepted: Set[str] = set()
+        for api_class in self.catalog.mro(class_name):
+            init: ApiFunction | None = api_class.find_method("__init__")
+            if init is None:
+                continue
+            parameters = signature_parameters(init.signature)
+            if parameters is None:
+                return None
+            names, takes_kwargs = parameters
+            accepted |= names
+            if not takes_kwargs:
+                return frozenset(accepted)
+        return None  # The chain ended in `**kwargs` or without a known constructor.
+
+    # Checks.
+
+    def _check_keywords(
+        self, call: cst.Call, accepted: FrozenSet[str] | None, callee: str
+    ) -> None:
+        if accepted is None:
+            return
+        for arg in call.args:
+            if arg.keyword is not None and arg.keyword.value not in accepted:
+                self.removed_args.add(arg)
+                self._report(arg, f"{callee}() has no keyword argument {arg.keyword.value!r}", True)
+
+    def _fix_name(self, name: cst.Name, candidates: Sequence[str], message: str) -> None:
+        matches: List[str] = get_close_matches(name.value, candidates, n=2, cutoff=FIX_CUTOFF)
+        if len(matches) == 2:
+            # Only fix when one candidate is strictly the closest.
+            first, second = (SequenceMatcher(None, name.value, match).ratio() for match in matches)
+            matches = matches[:1] if first > second else matches
+        if len(matches) == 1:
+            self.renames[name] = matches[0]
+            self._report(name, f"{message}, using {matches[0]!r}", True)
+        else:
+            self._report(name, message)
+
+    def _check_call(self, call: cst.Call, enclosing_class: str | None) -> None:
+        func = call.func
+        if isinstance(func, cst.Name):
+            if self._is_defined(func):
+                return
+            api_class: ApiClass | None = self.catalog.find_class(func.value)
+            if api_class is not None:
+                self._check_keywords(call, self._accepted_keywords(func.value), func.value)
+            elif self.catalog.find_function(func.value) is not None:
+                return
+            elif func.value in self.catalog.exports:
+                # Real manim API the catalog does not describe: neither reject nor rename it.
+                self._report(
+                    func,
+                    f"{func.value!r} is exported by manim but not in the API catalog, not checked",
+                    warning=True,
+                )
+            else:
+                self._fix_name(
+                    func,
+                    [*self.catalog.class_names(), *self.catalog.function_names()],
+                    f"{func.value!r} is not defined and is not part of the Manim API",
+                )
+            return
+
+        if not isinstance(func, cst.Attribute):
+            return
+        class_name: str | None = self._instance_class(func.value, enclosing_class)
+        if class_name is None:
+            return
+        method_name: str = func.attr.value
+        if method_name in self._local_methods(class_name):
+            return
+
+        catalog_classes: List[str] = [
+            base for base in self._catalog_bases(class_name) if base not in self.local_classes
+        ]
+        if not catalog_classes:
+            return  # A plain local class: its methods were checked above.
+        for catalog_class in catalog_classes:
+            mro: List[ApiClass] | None = self._complete_mro(catalog_class)
+            if mro is None:
+                return
+            method: ApiFunction | None = next(
+                (m for api_class in mro if (m := api_class.find_method(method_name))), None
+            )
+            if method is not None and method.is_property:
+                # Calls the property's value, e.g. `mobject.animate(run_time=2)`.
+                return
+            if method is not None:
+                parameters = signature_parameters(method.signature)
+                if parameters is not None and not parameters[1]:
+                    self._check_keywords(call, parameters[0], f"{catalog_class}.{method_name}")
+                return
+
+        if method_name.startswith(DYNAMIC_METHOD_PREFIXES):
+            return
+        methods: List[str] = [
+            method.name
+            for catalog_class in catalog_classes
+            for api_class in self.catalog.mro(catalog_class)
+            for method in api_class.methods
+        ]
+        self._fix_name(func.attr, methods, f"{class_name} has no method {method_name!r}")
+
+
+class _Fixer(cst.CSTTransformer):
+    def __init__(self, renames: Dict[cst.Name, str], removed_args: Set[cst.Arg]) -> None:
+        super().__init__()
+        self.renames: Dict[cst.Name, str] = renames
+        self.removed_args: Set[cst.Arg] = removed_args
+
+    def leave_Name(self, original_node: cst.Name, updated_node: cst.Name) -> cst.Name:
+        if original_node in self.renames:
+            return updated_node.with_changes(value=self.renames[original_node])
+        return updated_node
+
+    def leave_Arg(self, original_node: cst.Arg, updated_node: cst.Arg):
+        if original_node in self.removed_args:
+            return cst.RemoveFromParent()
+        return updated_node
+
+
+def validate_code(
+    code: str,
+    module: cst.Module | None = None,
+    catalog: ApiCatalog | None = None,
+    auto_fix: bool = True,
+) -> ValidationResult:
+    """
+    Validates generated code against the API catalog; `module` is its already parsed CST.
+
+    The result holds the (possibly fixed) code and module, and every issue found.
+    With `auto_fix=False` fixable issues reject the code as well.
+    """
+    start: float = perf_counter()
+    result: ValidationResult = ValidationResult(code, module)
+
+    try:
+        compile(code, "generated_code.py", "exec", dont_inherit=True)
+        if result.module is None:
+            result.module = cst.parse_module(code)
+    except (SyntaxError, ValueError, cst.ParserSyntaxError) as e:
+        result.module = None
+        result.issues.append(ValidationIssue(getattr(e, "lineno", 0) or 0, f"does not compile: {e}"))
+        result.seconds = perf_counter() - start
+        return result
+
+    checker: _Checker = _Checker(catalog or get_catalog())
+    wrapper: MetadataWrapper = MetadataWrapper(result.module, unsafe_skip_copy=True)
+    wrapper.visit(checker)
+
+    if not find_scene_names(result.module):
+        result.issues.append(ValidationIssue(0, "no Scene subclass with a construct method"))
+    result.issues.extend(checker.issues)
+    result.issues.sort(key=lambda issue: issue.line)
+
+    if not auto_fix:
+        for issue in result.issues:
+            issue.fixed = False
+    elif result.ok and result.fixed:
+        result.module = result.module.visit(_Fixer(checker.renames, checker.removed_args))
+        result.code = result.module.code
+
+    result.seconds = perf_counter() - start
+    return result
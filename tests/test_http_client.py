@@ -0,0 +1,197 @@
+"""
+Retry, backoff and circuit breaker behaviour of `http_client` against a local mock server.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+
+from typing import Callable, Iterator, List, Tuple
+
+import pytest
+from httpx import HTTPStatusError
+
+from mAInim import http_client
+from mAInim.http_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    backoff_delay,
+    post_json,
+    stream_text,
+)
+
+# The `respond` arguments for each request in turn, or a handler taking over the request.
+Reply = Tuple | Callable[[BaseHTTPRequestHandler], None]
+
+
+def respond(
+    handler: BaseHTTPRequestHandler,
+    status: int,
+    body: bytes,
+    content_type: str = "application/json",
+    length: int | None = None,
+) -> None:
+    handler.send_response(status)
+    handler.send_header("Content-Type", content_type)
+    handler.send_header("Content-Length", str(len(body) if length is None else length))
+    handler.end_headers()
+    handler.wfile.write(body)
+    handler.wfile.flush()
+
+
+class MockBackend:
+    def __init__(self, replies: List[Reply]) -> None:
+        self.replies: List[Reply] = replies
+        self.requests: int = 0
+        backend: MockBackend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers["Content-Length"]))
+                reply: Reply = backend.replies[min(backend.requests, len(backend.replies) - 1)]
+                backend.requests += 1
+                if callable(reply):
+                    reply(self)
+                    return
+                respond(self, *reply)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self.server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url: str = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def serve() -> Iterator[Callable[[List[Reply]], MockBackend]]:
+    backends: List[MockBackend] = []
+
+    def start(replies: List[Reply]) -> MockBackend:
+        backends.append(MockBackend(replies))
+        return backends[-1]
+
+    yield start
+    for backend in backends:
+        backend.server.shutdown()
+        backend.server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    """
+    Records the backoff attempts instead of sleeping for them.
+    """
+    attempts: List[int] = []
+
+    def backoff_delay(attempt: int) -> float:
+        attempts.append(attempt)
+        return 0.0
+
+    monkeypatch.setattr(http_client, "backoff_delay", backoff_delay)
+    return attempts
+
+
+def output(text: str) -> Tuple[int, bytes]:
+    return 200, json.dumps({"output": text}).encode()
+
+
+def test_retries_retryable_statuses_with_backoff(serve, no_backoff) -> None:
+    backend: MockBackend = serve([(503, b"{}"), (429, b"{}"), output("done")])
+    result = asyncio.run(post_json(backend.url, {}, max_retries=3, breaker=CircuitBreaker()))
+    assert result == {"output": "done"}
+    assert backend.requests == 3
+    assert no_backoff == [0, 1]
+
+
+def test_does_not_retry_other_errors(serve, no_backoff) -> None:
+    backend: MockBackend = serve([(400, b"{}"), output("unreachable")])
+    with pytest.raises(HTTPStatusError):
+        asyncio.run(post_json(backend.url, {}, max_retries=3, breaker=CircuitBreaker()))
+    assert backend.requests == 1
+    assert no_backoff == []
+
+
+def test_raises_the_last_error_once_retries_are_exhausted(serve) -> None:
+    backend: MockBackend = serve([(502, b"{}")])
+    with pytest.raises(HTTPStatusError) as error:
+        asyncio.run(post_json(backend.url, {}, max_retries=2, breaker=CircuitBreaker()))
+    assert error.value.response.status_code == 502
+    assert backend.requests == 2
+
+
+def test_backoff_is_full_jitter_capped() -> None:
+    # Imported above, so this is the real function the fixture patches out of the module.
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, base=1.0, cap=4.0) <= min(4.0, 2**attempt)
+
+
+def test_circuit_opens_and_stops_sending(serve) -> None:
+    backend: MockBackend = serve([(503, b"{}")])
+    breaker: CircuitBreaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    with pytest.raises(HTTPStatusError):
+        asyncio.run(post_json(backend.url, {}, max_retries=3, breaker=breaker))
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(post_json(backend.url, {}, max_retries=3, breaker=breaker))
+    assert backend.requests == 3
+
+
+def test_half_open_circuit_lets_a_single_trial_through(serve) -> None:
+    def slow_output(handler: BaseHTTPRequestHandler) -> None:
+        sleep(0.3)
+        respond(handler, *output("recovered"))
+
+    backend: MockBackend = serve([(503, b"{}"), slow_output])
+    breaker: CircuitBreaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    with pytest.raises(HTTPStatusError):
+        asyncio.run(post_json(backend.url, {}, max_retries=1, breaker=breaker))
+    sleep(0.15)
+    assert breaker.is_half_open
+
+    async def concurrent_callers() -> List[object]:
+        return await asyncio.gather(
+            *(post_json(backend.url, {}, max_retries=1, breaker=breaker) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results: List[object] = asyncio.run(concurrent_callers())
+    assert results.count({"output": "recovered"}) == 1
+    assert sum(isinstance(result, CircuitOpenError) for result in results) == 2
+    assert backend.requests == 2
+    assert not breaker.is_open and not breaker.is_half_open
+
+
+def test_failed_trial_opens_the_circuit_again(serve) -> None:
+    backend: MockBackend = serve([(503, b"{}")])
+    breaker: CircuitBreaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    with pytest.raises(HTTPStatusError):
+        asyncio.run(post_json(backend.url, {}, max_retries=1, breaker=breaker))
+    sleep(0.15)
+    with pytest.raises(HTTPStatusError):
+        asyncio.run(post_json(backend.url, {}, max_retries=1, breaker=breaker))
+    assert breaker.is_open
+    assert backend.requests == 2
+
+
+def test_stalled_stream_is_retried(serve) -> None:
+    def stall(handler: BaseHTTPRequestHandler) -> None:
+        # Headers promising a body that never comes.
+        respond(handler, 200, b"", "text/plain", length=100)
+        sleep(3)
+
+    backend: MockBackend = serve([stall, (200, b"hello", "text/plain")])
+
+    async def read() -> str:
+        chunks: List[str] = []
+        async for chunk in stream_text(
+            backend.url, {}, max_retries=2, attempt_timeout=0.5, breaker=CircuitBreaker()
+        ):
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    assert asyncio.run(read()) == "hello"
+    assert backend.requests == 2
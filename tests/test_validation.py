@@ -0,0 +1,48 @@
+"""
+Validation of generated code against the bundled API catalog.
+"""
+
+import pytest
+
+from mAInim import api_catalog
+from mAInim.api_catalog import ApiCatalog, load_catalog
+from mAInim.validation import ValidationResult, validate_code
+
+
+@pytest.fixture(autouse=True)
+def bundled_catalog(monkeypatch: pytest.MonkeyPatch) -> ApiCatalog:
+    """
+    Validates against the bundled reference, whether or not manim is installed.
+    """
+    catalog: ApiCatalog = load_catalog()
+    monkeypatch.setattr(api_catalog, "get_catalog", lambda: catalog)
+    return catalog
+
+
+def scene(body: str) -> str:
+    return (
+        "from manim import *\n\n\n"
+        "class Example(Scene):\n"
+        "    def construct(self):\n"
+        "        t = Circle()\n"
+        f"        {body}\n"
+    )
+
+
+def test_property_calls_keep_their_arguments(bundled_catalog: ApiCatalog) -> None:
+    assert bundled_catalog.find_method("Circle", "animate").is_property
+    code: str = scene("self.play(t.animate(run_time=2).shift(UP))")
+    result: ValidationResult = validate_code(code, catalog=bundled_catalog)
+    assert result.ok
+    assert result.issues == []
+    assert result.code == code
+
+
+def test_unknown_method_keywords_are_removed(bundled_catalog: ApiCatalog) -> None:
+    code: str = scene("self.play(t.animate.shift(UP))\n        t.set_z_index(1, speed=2)")
+    result: ValidationResult = validate_code(code, catalog=bundled_catalog)
+    assert result.ok
+    assert "speed" not in result.code
+    assert [issue.message for issue in result.issues] == [
+        "Circle.set_z_index() has no keyword argument 'speed'"
+    ]